@@ -17,22 +17,33 @@ Usage:
 import asyncio
 import os
 import sys
+from collections import Counter
 from datetime import datetime
+from uuid import UUID
 
 # Add parent directory to path to import tasklib
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from tasklib import (
     Config,
-    get_task,
+    count_by_state,
+    get_tasks,
     has_error,
     has_result,
     init,
-    is_completed,
-    is_failed,
-    is_pending,
-    is_running,
+    is_terminal,
 )
+from tasklib.db import TASK_STATE_CHANGED, TaskListener
+
+# Full refresh interval used when no state-change notification arrives
+FALLBACK_POLL_SECONDS = 30
+
+STATUS_LABELS = {
+    "pending": "⏳ PENDING",
+    "running": "⚙️  RUNNING",
+    "completed": "✅ COMPLETED",
+    "failed": "❌ FAILED",
+}
 
 
 def format_result(value, max_len=50):
@@ -69,14 +80,9 @@ def print_task_details(task, index=None):
         print(f"  Retries:   {task.retry_count}/{task.max_retries}")
 
     # Status indicators
-    if is_pending(task):
-        print("  Status:    ⏳ PENDING")
-    elif is_running(task):
-        print("  Status:    ⚙️  RUNNING")
-    elif is_completed(task):
-        print("  Status:    ✅ COMPLETED")
-    elif is_failed(task):
-        print("  Status:    ❌ FAILED")
+    status = STATUS_LABELS.get(task.state)
+    if status:
+        print(f"  Status:    {status}")
 
     # Results
     if has_result(task):
@@ -104,15 +110,13 @@ async def monitor_specific_tasks() -> None:
         return
 
     # Read task IDs from file
-    with open(task_ids_file, "r") as f:
-        lines = f.readlines()
-
     task_data = []
-    for line in lines:
-        parts = line.strip().split(None, 1)
-        if len(parts) == 2:
-            task_id, name = parts
-            task_data.append((task_id, name))
+    with open(task_ids_file, "r") as f:
+        for line in f:
+            task_id, _, name = line.strip().partition(" ")
+            name = name.lstrip()
+            if task_id and name:
+                task_data.append((task_id, name))
 
     print("=" * 80)
     print("TaskLib Example: Monitor Tasks")
@@ -120,17 +124,20 @@ async def monitor_specific_tasks() -> None:
     print(f"Timestamp: {datetime.now().isoformat()}")
     print(f"Monitoring {len(task_data)} tasks\n")
 
-    # Fetch all task details
+    # Fetch all task details in one query
     tasks = []
+    try:
+        tasks_by_id = {t.id: t for t in get_tasks([UUID(task_id) for task_id, _ in task_data])}
+    except Exception as e:
+        print(f"❌ Error fetching tasks: {e}")
+        tasks_by_id = {}
+
     for task_id, name in task_data:
-        try:
-            task = await get_task(task_id)  # pyrefly: ignore
-            if task:
-                tasks.append((name, task))
-            else:
-                print(f"⚠️  Task not found: {task_id}")
-        except Exception as e:
-            print(f"❌ Error fetching task {task_id}: {e}")
+        task = tasks_by_id.get(UUID(task_id))
+        if task:
+            tasks.append((name, task))
+        else:
+            print(f"⚠️  Task not found: {task_id}")
 
     if not tasks:
         print("No tasks to monitor")
@@ -143,19 +150,21 @@ async def monitor_specific_tasks() -> None:
     print("SUMMARY")
     print("-" * 80)
 
-    states = {"pending": 0, "running": 0, "completed": 0, "failed": 0}
+    # Group by state and count results/errors in a single pass
+    by_state = {"pending": [], "running": [], "completed": [], "failed": []}
+    with_results = 0
+    with_errors = 0
     for name, task in tasks:
-        states[task.state] = states.get(task.state, 0) + 1
+        by_state.setdefault(task.state, []).append((name, task))
+        with_results += has_result(task)
+        with_errors += has_error(task)
 
     print(f"Total tasks:     {len(tasks)}")
-    print(f"  ⏳ Pending:    {states.get('pending', 0)}")
-    print(f"  ⚙️  Running:    {states.get('running', 0)}")
-    print(f"  ✅ Completed:  {states.get('completed', 0)}")
-    print(f"  ❌ Failed:     {states.get('failed', 0)}")
-
-    # Count results and errors
-    with_results = sum(1 for _, t in tasks if has_result(t))
-    with_errors = sum(1 for _, t in tasks if has_error(t))
+    print(f"  ⏳ Pending:    {len(by_state['pending'])}")
+    print(f"  ⚙️  Running:    {len(by_state['running'])}")
+    print(f"  ✅ Completed:  {len(by_state['completed'])}")
+    print(f"  ❌ Failed:     {len(by_state['failed'])}")
+
     print(f"\nResults stored: {with_results}")
     print(f"Errors logged:  {with_errors}")
 
@@ -166,11 +175,6 @@ async def monitor_specific_tasks() -> None:
     print("DETAILED TASK INFORMATION")
     print("=" * 80)
 
-    # Group by state
-    by_state = {"pending": [], "running": [], "completed": [], "failed": []}
-    for name, task in tasks:
-        by_state[task.state].append((name, task))
-
     # Print pending tasks
     if by_state["pending"]:
         print(f"\n⏳ PENDING TASKS ({len(by_state['pending'])})")
@@ -220,8 +224,26 @@ async def monitor_specific_tasks() -> None:
     """)
 
 
-async def continuous_monitoring() -> None:
-    """Continuously monitor tasks until all are done."""
+def changed_task_ids(payloads: list[str], current_states: dict) -> list[UUID]:
+    """Pick monitored task IDs whose notified state differs from what we last saw."""
+    changed = []
+    for payload in payloads:
+        task_id, _, state = payload.partition(" ")
+        task_id = UUID(task_id)
+        if task_id in current_states and current_states[task_id] != state:
+            changed.append(task_id)
+    return list(dict.fromkeys(changed))
+
+
+async def continuous_monitoring(database_url: str) -> None:
+    """Continuously monitor tasks until all are done.
+
+    Instead of re-querying every task on a timer, this LISTENs for state-change
+    notifications and only re-fetches the tasks that changed. The per-state
+    totals come from a GROUP BY query rather than counting rows in Python. A
+    slow full refresh still runs if no notification arrives for
+    FALLBACK_POLL_SECONDS.
+    """
     task_ids_file = "examples/task_ids.txt"
 
     if not os.path.exists(task_ids_file):
@@ -229,14 +251,12 @@ async def continuous_monitoring() -> None:
         return
 
     # Read task IDs
-    with open(task_ids_file, "r") as f:
-        lines = f.readlines()
-
     task_ids = []
-    for line in lines:
-        parts = line.strip().split(None, 1)
-        if len(parts) >= 1:
-            task_ids.append(parts[0])
+    with open(task_ids_file, "r") as f:
+        for line in f:
+            task_id, _, _ = line.strip().partition(" ")
+            if task_id:
+                task_ids.append(UUID(task_id))
 
     print("=" * 80)
     print("TaskLib Example: Continuous Monitoring")
@@ -245,62 +265,68 @@ async def continuous_monitoring() -> None:
     print("(Press Ctrl+C to stop)\n")
 
     previous_states = {}
+    tasks_by_id = {}
+    to_fetch = task_ids
+    states = Counter()
 
     try:
-        while True:
-            # Fetch all tasks
-            tasks = []
-            for task_id in task_ids:
+        async with TaskListener(database_url, TASK_STATE_CHANGED) as listener:
+            while True:
+                # Fetch new or changed tasks in one query; counts are aggregated server-side
                 try:
-                    task = await get_task(task_id)  # pyrefly: ignore
-                    if task:
-                        tasks.append(task)
+                    tasks_by_id.update((t.id, t) for t in get_tasks(to_fetch))
+                    states = Counter(count_by_state(task_ids))
                 except Exception:
                     pass
 
-            # Check if states changed
-            current_states = {t.id: t.state for t in tasks}
-
-            # Print header
-            print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Status Update")
-            print("-" * 80)
-
-            # Count by state
-            states = {
-                "pending": sum(1 for t in tasks if is_pending(t)),
-                "running": sum(1 for t in tasks if is_running(t)),
-                "completed": sum(1 for t in tasks if is_completed(t)),
-                "failed": sum(1 for t in tasks if is_failed(t)),
-            }
-
-            print(f"⏳ Pending:   {states['pending']}")
-            print(f"⚙️  Running:   {states['running']}")
-            print(f"✅ Completed: {states['completed']}")
-            print(f"❌ Failed:    {states['failed']}")
-
-            # Show changes
-            changes = []
-            for task_id, new_state in current_states.items():
-                old_state = previous_states.get(task_id)
-                if old_state and old_state != new_state:
-                    changes.append(f"  {task_id[:8]}... {old_state} → {new_state}")
-
-            if changes:
-                print("\nState changes:")
-                for change in changes:
-                    print(change)
-
-            previous_states = current_states
-
-            # Check if all done
-            if states["pending"] == 0 and states["running"] == 0:
-                print("\n" + "=" * 80)
-                print("✅ All tasks completed!")
-                print("=" * 80)
-                break
-
-            # Wait before next check
-            await asyncio.sleep(3)
+                tasks = list(tasks_by_id.values())
+
+                # Check if states changed
+                current_states = {t.id: t.state for t in tasks}
+
+                # Print header
+                print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Status Update")
+                print("-" * 80)
+
+                print(f"⏳ Pending:   {states['pending']}")
+                print(f"⚙️  Running:   {states['running']}")
+                print(f"✅ Completed: {states['completed']}")
+                print(f"❌ Failed:    {states['failed']}")
+
+                # Show changes
+                changes = []
+                for task_id, new_state in current_states.items():
+                    old_state = previous_states.get(task_id)
+                    if old_state and old_state != new_state:
+                        changes.append(f"  {str(task_id)[:8]}... {old_state} → {new_state}")
+
+                if changes:
+                    print("\nState changes:")
+                    for change in changes:
+                        print(change)
+
+                previous_states = current_states
+
+                # Check if all done
+                if states["pending"] == 0 and states["running"] == 0:
+                    print("\n" + "=" * 80)
+                    print("✅ All tasks completed!")
+                    print("=" * 80)
+                    break
+
+                # Wait for one of our tasks to change state (or fall back to a full refresh)
+                to_fetch = []
+                while not to_fetch:
+                    payloads = await listener.wait(timeout=FALLBACK_POLL_SECONDS)
+                    if not payloads:
+                        # Tasks in a terminal state never change again; keep the cached copy
+                        to_fetch = [
+                            task_id
+                            for task_id in task_ids
+                            if task_id not in tasks_by_id or not is_terminal(tasks_by_id[task_id])
+                        ]
+                        break
+                    to_fetch = changed_task_ids(payloads, current_states)
 
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped.")
@@ -313,7 +339,7 @@ async def main() -> None:
 
     # Initialize TaskLib
     config = Config(database_url=db_url)
-    await init(config)  # pyrefly: ignore
+    init(config)
 
     # Choose monitoring mode
     print("TaskLib Monitoring Options:")
@@ -324,7 +350,7 @@ async def main() -> None:
     choice = input("Choose option (1 or 2): ").strip()
 
     if choice == "2":
-        await continuous_monitoring()
+        await continuous_monitoring(db_url)
     else:
         await monitor_specific_tasks()
 
@@ -65,16 +65,14 @@ async def check_status(task_ids: list):
     print("\nChecking task status (sleeping 10s)...")
     await asyncio.sleep(10)
 
-    for task_id in task_ids:
-        task = tasklib.get_task(task_id)
-        if task:
-            print(
-                f"\nTask {task_id}:"
-                f"\n  State: {task.state}"
-                f"\n  Result: {task.result}"
-                f"\n  Error: {task.error}"
-                f"\n  Retries: {task.retry_count}/{task.max_retries}"
-            )
+    for task in tasklib.get_tasks(task_ids):
+        print(
+            f"\nTask {task.id}:"
+            f"\n  State: {task.state}"
+            f"\n  Result: {task.result}"
+            f"\n  Error: {task.error}"
+            f"\n  Retries: {task.retry_count}/{task.max_retries}"
+        )
 
 
 async def main():
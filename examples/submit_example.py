@@ -24,7 +24,7 @@ from uuid import UUID
 # Add parent directory to path to import tasklib
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from tasklib import Config, init, submit_task
+from tasklib import Config, init, submit_tasks
 
 # Import tasks to register them
 from .tasks import (  # pyrefly: ignore
@@ -47,7 +47,7 @@ from .tasks import (  # pyrefly: ignore
 
 async def submit_all_tasks() -> list[tuple[str, UUID]]:
     """Submit various tasks and return their IDs."""
-    task_ids = []
+    submissions = []
 
     print("=" * 80)
     print("TaskLib Example: Submitting Tasks")
@@ -61,19 +61,13 @@ async def submit_all_tasks() -> list[tuple[str, UUID]]:
     print("-" * 80)
 
     print("Task 1: Simple addition (immediate)")
-    task_id = await submit_task(simple_add, a=5, b=3)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("simple_add(5, 3)", task_id))
+    submissions.append(("simple_add(5, 3)", simple_add, {"a": 5, "b": 3}))
 
     print("Task 2: Greeting with default parameter")
-    task_id = await submit_task(greet, name="Alice")
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("greet(name='Alice')", task_id))
+    submissions.append(("greet(name='Alice')", greet, {"name": "Alice"}))
 
     print("Task 3: Greeting with custom greeting")
-    task_id = await submit_task(greet, name="Bob", greeting="Hi")
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("greet(name='Bob', greeting='Hi')", task_id))
+    submissions.append(("greet(name='Bob', greeting='Hi')", greet, {"name": "Bob", "greeting": "Hi"}))
 
     # ========================================================================
     # Section 2: Delayed Tasks
@@ -82,14 +76,10 @@ async def submit_all_tasks() -> list[tuple[str, UUID]]:
     print("-" * 80)
 
     print("Task 4: Delayed task (execute in 5 seconds)")
-    task_id = await submit_task(simple_add, a=100, b=200, delay_seconds=5)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("simple_add(100, 200) [delayed 5s]", task_id))
+    submissions.append(("simple_add(100, 200) [delayed 5s]", simple_add, {"a": 100, "b": 200, "delay_seconds": 5}))
 
     print("Task 5: Delayed greeting (execute in 3 seconds)")
-    task_id = await submit_task(greet, name="Charlie", delay_seconds=3)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("greet(name='Charlie') [delayed 3s]", task_id))
+    submissions.append(("greet(name='Charlie') [delayed 3s]", greet, {"name": "Charlie", "delay_seconds": 3}))
 
     # ========================================================================
     # Section 3: Priority Tasks
@@ -98,14 +88,32 @@ async def submit_all_tasks() -> list[tuple[str, UUID]]:
     print("-" * 80)
 
     print("Task 6: Low priority task (priority=1)")
-    task_id = await submit_task(simple_add, a=1, b=1, priority=1, tags={"importance": "low"})
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("simple_add(1, 1) [priority=1]", task_id))
+    submissions.append(
+        (
+            "simple_add(1, 1) [priority=1]",
+            simple_add,
+            {
+                "a": 1,
+                "b": 1,
+                "priority": 1,
+                "tags": {"importance": "low"},
+            },
+        )
+    )
 
     print("Task 7: High priority task (priority=10)")
-    task_id = await submit_task(simple_add, a=10, b=10, priority=10, tags={"importance": "high"})
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("simple_add(10, 10) [priority=10]", task_id))
+    submissions.append(
+        (
+            "simple_add(10, 10) [priority=10]",
+            simple_add,
+            {
+                "a": 10,
+                "b": 10,
+                "priority": 10,
+                "tags": {"importance": "high"},
+            },
+        )
+    )
 
     # ========================================================================
     # Section 4: Complex Tasks
@@ -115,21 +123,15 @@ async def submit_all_tasks() -> list[tuple[str, UUID]]:
 
     print("Task 8: Text processing")
     text = "Hello World! This is a test of the TaskLib library."
-    task_id = await submit_task(process_text, text=text)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("process_text(...)", task_id))
+    submissions.append(("process_text(...)", process_text, {"text": text}))
 
     print("Task 9: Batch processing")
     items = ["apple", "banana", "cherry", "date", "elderberry"]
-    task_id = await submit_task(batch_process, items=items)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("batch_process([...])", task_id))
+    submissions.append(("batch_process([...])", batch_process, {"items": items}))
 
     print("Task 10: Statistics calculation")
     data = [1.5, 2.7, 3.2, 4.1, 5.8, 6.3, 7.9]
-    task_id = await submit_task(calculate_statistics, data=data)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("calculate_statistics([...])", task_id))
+    submissions.append(("calculate_statistics([...])", calculate_statistics, {"data": data}))
 
     # ========================================================================
     # Section 5: I/O Tasks
@@ -138,14 +140,10 @@ async def submit_all_tasks() -> list[tuple[str, UUID]]:
     print("-" * 80)
 
     print("Task 11: I/O task (sleep 1 second)")
-    task_id = await submit_task(io_task, duration_seconds=1)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("io_task(1s)", task_id))
+    submissions.append(("io_task(1s)", io_task, {"duration_seconds": 1}))
 
     print("Task 12: I/O task with longer duration (sleep 2 seconds)")
-    task_id = await submit_task(io_task, duration_seconds=2)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("io_task(2s)", task_id))
+    submissions.append(("io_task(2s)", io_task, {"duration_seconds": 2}))
 
     # ========================================================================
     # Section 6: Error Handling & Retries
@@ -154,29 +152,19 @@ async def submit_all_tasks() -> list[tuple[str, UUID]]:
     print("-" * 80)
 
     print("Task 13: Unreliable task (50% success rate, will retry)")
-    task_id = await submit_task(unreliable_task, success_rate=0.5)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("unreliable_task(50%)", task_id))
+    submissions.append(("unreliable_task(50%)", unreliable_task, {"success_rate": 0.5}))
 
     print("Task 14: Unreliable task (80% success rate)")
-    task_id = await submit_task(unreliable_task, success_rate=0.8)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("unreliable_task(80%)", task_id))
+    submissions.append(("unreliable_task(80%)", unreliable_task, {"success_rate": 0.8}))
 
     print("Task 15: Task with custom retries")
-    task_id = await submit_task(task_with_custom_retries)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("task_with_custom_retries()", task_id))
+    submissions.append(("task_with_custom_retries()", task_with_custom_retries, {}))
 
     print("Task 16: Validation task (valid)")
-    task_id = await submit_task(validation_task, value=42)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("validation_task(42)", task_id))
+    submissions.append(("validation_task(42)", validation_task, {"value": 42}))
 
     print("Task 17: Validation task (invalid - negative)")
-    task_id = await submit_task(validation_task, value=-5)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("validation_task(-5) [ERROR]", task_id))
+    submissions.append(("validation_task(-5) [ERROR]", validation_task, {"value": -5}))
 
     # ========================================================================
     # Section 7: Real-World Tasks
@@ -185,29 +173,26 @@ async def submit_all_tasks() -> list[tuple[str, UUID]]:
     print("-" * 80)
 
     print("Task 18: Send email (notification)")
-    task_id = await submit_task(
-        send_email,
-        to="alice@example.com",
-        subject="Welcome",
-        body="Welcome to our platform!",
+    submissions.append(
+        (
+            "send_email(alice@...)",
+            send_email,
+            {
+                "to": "alice@example.com",
+                "subject": "Welcome",
+                "body": "Welcome to our platform!",
+            },
+        )
     )
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("send_email(alice@...)", task_id))
 
     print("Task 19: Generate report (PDF)")
-    task_id = await submit_task(generate_report, report_type="PDF", include_charts=True)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("generate_report(PDF)", task_id))
+    submissions.append(("generate_report(PDF)", generate_report, {"report_type": "PDF", "include_charts": True}))
 
     print("Task 20: Database operation (insert)")
-    task_id = await submit_task(database_task, operation="insert")
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("database_task(insert)", task_id))
+    submissions.append(("database_task(insert)", database_task, {"operation": "insert"}))
 
     print("Task 21: Database operation (update)")
-    task_id = await submit_task(database_task, operation="update")
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("database_task(update)", task_id))
+    submissions.append(("database_task(update)", database_task, {"operation": "update"}))
 
     # ========================================================================
     # Section 8: Performance Tests
@@ -216,14 +201,21 @@ async def submit_all_tasks() -> list[tuple[str, UUID]]:
     print("-" * 80)
 
     print("Task 22: CPU-intensive work (100K iterations)")
-    task_id = await submit_task(cpu_work, iterations=100000)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("cpu_work(100K)", task_id))
+    submissions.append(("cpu_work(100K)", cpu_work, {"iterations": 100000}))
 
     print("Task 23: Memory allocation (5MB)")
-    task_id = await submit_task(memory_task, size_mb=5)
-    print(f"  Submitted: {task_id}\n")
-    task_ids.append(("memory_task(5MB)", task_id))
+    submissions.append(("memory_task(5MB)", memory_task, {"size_mb": 5}))
+
+    # ========================================================================
+    # Submit everything in one batch
+    # ========================================================================
+    ids = await submit_tasks([(func, kwargs) for _, func, kwargs in submissions])
+    task_ids = [(name, task_id) for (name, _, _), task_id in zip(submissions, ids)]
+
+    print("\n📌 Submitted task IDs")
+    print("-" * 80)
+    for name, task_id in task_ids:
+        print(f"  {task_id}  {name}")
 
     # ========================================================================
     # Summary
@@ -249,7 +241,7 @@ async def main() -> None:
 
     # Initialize TaskLib
     config = Config(database_url=db_url)
-    await init(config)  # pyrefly: ignore
+    init(config)
 
     # Submit all tasks
     try:
@@ -257,8 +249,7 @@ async def main() -> None:
 
         # Save task IDs to file for later monitoring
         with open("examples/task_ids.txt", "w") as f:
-            for name, task_id in task_ids:
-                f.write(f"{task_id}  {name}\n")
+            f.write("".join(f"{task_id}  {name}\n" for name, task_id in task_ids))
 
         print("\n📝 Task IDs saved to: examples/task_ids.txt")
         print("\nYou can now run monitor_example.py to check progress:")
@@ -2,6 +2,7 @@
 
 import random
 import time
+from array import array
 
 from tasklib import task
 
@@ -38,8 +39,8 @@ def process_text(text: str) -> dict:
     result = {
         "length": len(text),
         "words": len(text.split()),
-        "uppercase": sum(1 for c in text if c.isupper()),
-        "lowercase": sum(1 for c in text if c.islower()),
+        "uppercase": sum(map(str.isupper, text)),
+        "lowercase": sum(map(str.islower, text)),
     }
     print(f"Stats: {result}")
     return result
@@ -108,10 +109,7 @@ def database_task(operation: str) -> dict:
 def batch_process(items: list) -> dict:
     """Process a batch of items."""
     print(f"Processing batch of {len(items)} items")
-    results = []
-    for item in items:
-        processed = item.upper() if isinstance(item, str) else str(item)
-        results.append(processed)
+    results = [item.upper() if isinstance(item, str) else str(item) for item in items]
     print(f"Processed {len(results)} items")
     return {"count": len(results), "items": results}
 
@@ -123,10 +121,12 @@ def calculate_statistics(data: list[float]) -> dict:
     if not data:
         raise ValueError("Data list cannot be empty")
 
+    count = len(data)
+    total = sum(data)
     return {
-        "count": len(data),
-        "sum": sum(data),
-        "mean": sum(data) / len(data),
+        "count": count,
+        "sum": total,
+        "mean": total / count,
         "min": min(data),
         "max": max(data),
     }
@@ -157,11 +157,10 @@ def generate_report(report_type: str, include_charts: bool = False) -> dict:
 
 @task
 def cpu_work(iterations: int = 1000000) -> dict:
-    """CPU-intensive task."""
+    """CPU-intensive task: sum of i % 7 for i in range(iterations)."""
     print(f"Performing {iterations} iterations...")
-    result = 0
-    for i in range(iterations):
-        result += i % 7
+    # Deliberately computed one step at a time: the CPU load is what this example demonstrates
+    result = sum(i % 7 for i in range(iterations)) if iterations > 0 else 0
     print(f"Computation result: {result}")
     return {"iterations": iterations, "result": result}
 
@@ -170,6 +169,7 @@ def cpu_work(iterations: int = 1000000) -> dict:
 def memory_task(size_mb: int = 10) -> dict:
     """Task that allocates memory."""
     print(f"Allocating {size_mb}MB of memory...")
-    data = [random.random() for _ in range(size_mb * 100000)]
+    # One contiguous, zero-filled float64 buffer: 125,000 doubles = 1 MB
+    data = array("d", bytes(size_mb * 1_000_000))
     print(f"Allocated {len(data)} floats")
     return {"size_mb": size_mb, "items": len(data)}
@@ -25,7 +25,8 @@ async def main():
         worker_id="worker-1",  # Give worker a name
     )
 
-    worker = TaskWorker(config, concurrency=4, poll_interval_seconds=1.0)
+    # New tasks wake the worker via NOTIFY; polling only picks up delayed tasks and retries
+    worker = TaskWorker(config, concurrency=4, poll_interval_seconds=10.0)
 
     print("Starting worker... (Ctrl+C to stop)")
     await worker.run()
@@ -1,34 +1,73 @@
 -- Initialize TaskLib database with test data
 
+-- Task states, as the native enum tasklib creates
+DO $$
+BEGIN
+    CREATE TYPE task_state AS ENUM ('pending', 'running', 'completed', 'failed', 'cancelled');
+EXCEPTION
+    WHEN duplicate_object THEN NULL;
+END
+$$;
+
 -- Create tasks table if it doesn't exist
 CREATE TABLE IF NOT EXISTS tasks (
     id UUID PRIMARY KEY,
     name VARCHAR NOT NULL,
-    state VARCHAR NOT NULL,
-    scheduled_at TIMESTAMP NOT NULL,
-    started_at TIMESTAMP,
-    completed_at TIMESTAMP,
-    created_at TIMESTAMP NOT NULL,
+    state task_state NOT NULL,
+    scheduled_at TIMESTAMPTZ NOT NULL,
+    started_at TIMESTAMPTZ,
+    completed_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL,
     args JSONB NOT NULL DEFAULT '{}',
     kwargs JSONB NOT NULL DEFAULT '{}',
     result JSONB,
     error TEXT,
-    retry_count INTEGER NOT NULL DEFAULT 0,
-    max_retries INTEGER NOT NULL,
-    next_retry_at TIMESTAMP,
+    retry_count SMALLINT NOT NULL DEFAULT 0,
+    max_retries SMALLINT NOT NULL,
+    next_retry_at TIMESTAMPTZ,
     worker_id VARCHAR,
-    locked_until TIMESTAMP,
+    locked_until TIMESTAMPTZ,
     timeout_seconds INTEGER,
-    priority INTEGER NOT NULL DEFAULT 0,
+    priority SMALLINT NOT NULL DEFAULT 0,
     tags JSONB NOT NULL DEFAULT '{}'
 );
 
 -- Create indexes
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 CREATE INDEX IF NOT EXISTS idx_tasks_name ON tasks(name);
-CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks(state);
-CREATE INDEX IF NOT EXISTS idx_tasks_scheduled_at ON tasks(scheduled_at);
-CREATE INDEX IF NOT EXISTS idx_tasks_locked_until ON tasks(locked_until);
-CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_state_created_at ON tasks(state, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at_covering ON tasks(created_at DESC, id DESC) INCLUDE (state, retry_count, max_retries);
+CREATE INDEX IF NOT EXISTS idx_tasks_running_worker ON tasks(worker_id) INCLUDE (locked_until) WHERE state = 'running' AND worker_id IS NOT NULL;
+-- TaskLib's own ix_tasks_open_state, under its name so create_indexes_concurrently recognises it
+CREATE INDEX IF NOT EXISTS ix_tasks_open_state ON tasks(state) WHERE state <> 'completed';
+CREATE INDEX IF NOT EXISTS idx_tasks_name_trgm ON tasks USING GIN (name gin_trgm_ops);
+
+-- Task change notifications (same triggers tasklib installs), streamed by /api/events
+CREATE OR REPLACE FUNCTION tasklib_notify_state_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('task_state_changed', NEW.id::text || ' ' || NEW.state);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER tasks_notify_state_changed
+    AFTER UPDATE OF state ON tasks
+    FOR EACH ROW
+    WHEN (OLD.state IS DISTINCT FROM NEW.state)
+    EXECUTE FUNCTION tasklib_notify_state_changed();
+
+CREATE OR REPLACE FUNCTION tasklib_notify_task_enqueued() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('task_enqueued', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER tasks_notify_task_enqueued
+    AFTER INSERT ON tasks
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION tasklib_notify_task_enqueued();
 
 -- Clear existing test data
 TRUNCATE TABLE tasks;
@@ -1,9 +1,10 @@
 from datetime import datetime
+from enum import Enum
 from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel
-from sqlalchemy import Column, String, DateTime, Integer, JSON, Text
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import Column, String, DateTime, Index, Integer, JSON, SmallInteger, Text, text
+from sqlalchemy.dialects.postgresql import ENUM, UUID as PG_UUID
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -14,25 +15,74 @@ class Task(Base):
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True)
     name = Column(String, nullable=False, index=True)
-    state = Column(String, nullable=False, index=True)
-    scheduled_at = Column(DateTime, nullable=False, index=True)
-    started_at = Column(DateTime, nullable=True)
-    completed_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, nullable=False)
+    # tasklib's native task_state enum; the type is created by tasklib (or init.sql), not here
+    state = Column(
+        ENUM("pending", "running", "completed", "failed", "cancelled", name="task_state", create_type=False),
+        nullable=False,
+    )
+    scheduled_at = Column(DateTime(timezone=True), nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
     args = Column(JSON, nullable=False, default={})
     kwargs = Column(JSON, nullable=False, default={})
     result = Column(JSON, nullable=True)
     error = Column(Text, nullable=True)
-    retry_count = Column(Integer, nullable=False, default=0)
-    max_retries = Column(Integer, nullable=False)
-    next_retry_at = Column(DateTime, nullable=True)
+    retry_count = Column(SmallInteger, nullable=False, default=0)
+    max_retries = Column(SmallInteger, nullable=False)
+    next_retry_at = Column(DateTime(timezone=True), nullable=True)
     worker_id = Column(String, nullable=True)
-    locked_until = Column(DateTime, nullable=True, index=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
     timeout_seconds = Column(Integer, nullable=True)
-    priority = Column(Integer, nullable=False, default=0, index=True)
+    priority = Column(SmallInteger, nullable=False, default=0)
     tags = Column(JSON, nullable=False, default={})
 
 
+# Rows of the workers rollup, spelled with literals: a bound parameter in its place would leave a
+# generic prepared plan unable to prove the query matches the partial index below
+RUNNING_WORKER_PREDICATE = "state = 'running' AND worker_id IS NOT NULL"
+
+# Every task that is not completed; same literal-predicate rule as above
+OPEN_STATE_PREDICATE = "state <> 'completed'"
+
+# Indexes matching the dashboard's query shapes: state filter + newest-first listing,
+# unfiltered newest-first listing (also covering the stats aggregate over a time window),
+# the running-workers rollup, unfinished-task counts and name substring search.
+Index("idx_tasks_state_created_at", Task.state, Task.created_at.desc(), Task.id.desc())
+Index(
+    "idx_tasks_created_at_covering",
+    Task.created_at.desc(),
+    Task.id.desc(),
+    postgresql_include=["state", "retry_count", "max_retries"],
+)
+Index(
+    "idx_tasks_running_worker",
+    Task.worker_id,
+    postgresql_include=["locked_until"],
+    postgresql_where=text(RUNNING_WORKER_PREDICATE),
+)
+# Owned by tasklib (tasklib.db.models); mirrored under the same name, never as a second copy
+Index("ix_tasks_open_state", Task.state, postgresql_where=text(OPEN_STATE_PREDICATE))
+# gin_trgm_ops (ILIKE '%...%' on name) needs the pg_trgm extension. It is installed once by init.sql
+# (or the README's SQL) rather than at startup, which would require CREATE privilege on every run.
+Index(
+    "idx_tasks_name_trgm",
+    Task.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
+
+
+class TaskState(str, Enum):
+    """Task states (tasklib's task_state enum); "cancelled" is only set by the dashboard"""
+
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+    cancelled = "cancelled"
+
+
 # Pydantic models for API responses
 class TaskResponse(BaseModel):
     id: UUID
@@ -56,6 +106,21 @@ class TaskResponse(BaseModel):
         from_attributes = True
 
 
+class TaskSummary(BaseModel):
+    """Row of the task list; the full record is served by /api/task/{task_id}"""
+
+    id: UUID
+    name: str
+    state: str
+    created_at: datetime
+    started_at: Optional[datetime]
+    completed_at: Optional[datetime]
+    worker_id: Optional[str]
+    retry_count: int
+    max_retries: int
+    priority: int
+
+
 class TaskStats(BaseModel):
     total: int
     pending: int
@@ -63,9 +128,23 @@ class TaskStats(BaseModel):
     completed: int
     failed: int
     failed_permanent: int
+    # True when total and completed are derived from the planner's row estimate
+    estimated: bool = False
 
 
 class WorkerStats(BaseModel):
     worker_id: str
     locked_tasks: int
     earliest_lock_expires: Optional[datetime]
+
+
+class NextCursor(BaseModel):
+    created_at: datetime
+    id: UUID
+
+
+class DashboardResponse(BaseModel):
+    stats: TaskStats
+    workers: list[WorkerStats]
+    tasks: list[TaskSummary]
+    next_cursor: Optional[NextCursor]
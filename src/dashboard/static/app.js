@@ -0,0 +1,696 @@
+// pageCursors[n] is the cursor that loads page n (null for the first page)
+let pageCursors = [null];
+let currentPage = 0;
+const LIMIT = 50;
+
+// Query parameter name -> input element id for the task filters
+const FILTER_INPUTS = [
+    ['state', 'filter-state'],
+    ['name', 'filter-name'],
+    ['worker_id', 'filter-worker'],
+    ['priority_min', 'filter-priority'],
+    ['retry_count_min', 'filter-retries'],
+];
+
+// toLocaleString with options builds a new Intl.DateTimeFormat on every call; reuse one
+const DATE_FORMAT = new Intl.DateTimeFormat('en-US', {
+    month: 'short',
+    day: 'numeric',
+    hour: '2-digit',
+    minute: '2-digit',
+    second: '2-digit'
+});
+
+function updateAbsoluteDates() {
+    const relative = document.getElementById('filter-relative-time').value;
+    const now = new Date();
+    let from = new Date();
+
+    if (relative === '1h') from.setHours(from.getHours() - 1);
+    else if (relative === '6h') from.setHours(from.getHours() - 6);
+    else if (relative === '24h') from.setDate(from.getDate() - 1);
+    else if (relative === '7d') from.setDate(from.getDate() - 7);
+    else if (relative === '30d') from.setDate(from.getDate() - 30);
+    else {
+        document.getElementById('filter-time-from').value = '';
+        document.getElementById('filter-time-to').value = '';
+        return;
+    }
+
+    // Format as datetime-local (YYYY-MM-DDTHH:mm)
+    document.getElementById('filter-time-from').value = from.toISOString().slice(0, 16);
+    document.getElementById('filter-time-to').value = now.toISOString().slice(0, 16);
+
+    applyTimeFilter();
+}
+
+function applyTimeFilter() {
+    loadDashboard();
+}
+
+function getTimeParams() {
+    const from = document.getElementById('filter-time-from').value;
+    const to = document.getElementById('filter-time-to').value;
+    const params = {};
+
+    if (from) {
+        const fromDate = new Date(from);
+        params.created_after = fromDate.toISOString();
+    }
+    if (to) {
+        const toDate = new Date(to);
+        params.created_before = toDate.toISOString();
+    }
+
+    return params;
+}
+
+function renderStats(stats) {
+    // Estimated totals (large tables, no time filter) are marked as approximate
+    const approx = stats.estimated ? '~' : '';
+    document.getElementById('stat-total').textContent = approx + stats.total;
+    document.getElementById('stat-pending').textContent = stats.pending;
+    document.getElementById('stat-running').textContent = stats.running;
+    document.getElementById('stat-completed').textContent = approx + stats.completed;
+    document.getElementById('stat-failed').textContent = stats.failed;
+    document.getElementById('stat-failed-permanent').textContent = stats.failed_permanent;
+}
+
+// Filter inputs are read once when a search starts; paging through its results reuses them
+let activeFilters = new URLSearchParams();
+
+function readFilters() {
+    const params = new URLSearchParams();
+    for (const [name, id] of FILTER_INPUTS) {
+        const value = document.getElementById(id).value;
+        if (value) params.append(name, value);
+    }
+
+    // Add time parameters
+    const timeParams = getTimeParams();
+    if (timeParams.created_after) params.append('created_after', timeParams.created_after);
+    if (timeParams.created_before) params.append('created_before', timeParams.created_before);
+    return params;
+}
+
+function taskParams(page) {
+    if (page === 0) activeFilters = readFilters();
+    const params = new URLSearchParams(activeFilters);
+    params.append('limit', LIMIT);
+    const cursor = pageCursors[page];
+    if (cursor) {
+        params.append('cursor_created_at', cursor.created_at);
+        params.append('cursor_id', cursor.id);
+    }
+    return params;
+}
+
+// Only the latest task list request may render: starting a new one aborts the previous
+let tasksController = null;
+
+function startTasksRequest() {
+    if (tasksController) tasksController.abort();
+    tasksController = new AbortController();
+    return tasksController.signal;
+}
+
+async function loadTasks(page = 0) {
+    if (page === 0) pageCursors = [null];
+    currentPage = page;
+    const params = taskParams(page);
+    // One row past the page only tells whether a next page exists; it is not rendered
+    params.set('limit', LIMIT + 1);
+    const container = document.getElementById('tasks-container');
+    const signal = startTasksRequest();
+
+    try {
+        document.getElementById('error-message').replaceChildren();
+        container.replaceChildren(message('loading', 'Loading tasks...'));
+
+        // Rows arrive as NDJSON and are appended as each network chunk is decoded
+        const response = await fetch(`/api/tasks?${params}`, { headers: { Accept: 'application/x-ndjson' }, signal });
+        if (!response.ok) throw new Error('Failed to load tasks');
+
+        const readwrite = window.dashboardMode === 'readwrite';
+        const table = createTasksTable(readwrite);
+        const tbody = table.querySelector('tbody');
+        const reader = response.body.pipeThrough(new TextDecoderStream()).pipeThrough(splitLines()).getReader();
+        const rendered = new Map();
+        let count = 0;
+        let last = null;
+        let hasMore = false;
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            if (count === 0) container.replaceChildren(table);
+
+            const rows = document.createDocumentFragment();
+            for (const line of value) {
+                if (count === LIMIT) {
+                    hasMore = true;
+                    break;
+                }
+                last = JSON.parse(line);
+                rows.appendChild(taskRow(last, readwrite, rendered));
+                count++;
+            }
+            tbody.appendChild(rows);
+        }
+
+        taskRows = rendered;
+        pageCursors[page + 1] = hasMore ? { created_at: last.created_at, id: last.id } : null;
+        if (count === 0) {
+            container.replaceChildren(message('loading', 'No tasks found'));
+            return;
+        }
+        const pagination = createPagination();
+        if (pagination) container.appendChild(pagination);
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        document.getElementById('error-message').replaceChildren(message('error', `Error: ${error.message}`));
+        container.replaceChildren();
+    }
+}
+
+// TransformStream turning decoded text chunks into arrays of complete, non-empty lines
+function splitLines() {
+    let buffer = '';
+    return new TransformStream({
+        transform(chunk, controller) {
+            const lines = (buffer + chunk).split('\n');
+            buffer = lines.pop();
+            const complete = lines.filter(line => line);
+            if (complete.length) controller.enqueue(complete);
+        },
+        flush(controller) {
+            if (buffer) controller.enqueue([buffer]);
+        }
+    });
+}
+
+// Stats, workers and the first page of tasks from one request (one consistent snapshot)
+async function loadDashboard() {
+    pageCursors = [null];
+    currentPage = 0;
+    const params = taskParams(0);
+    const signal = startTasksRequest();
+
+    try {
+        document.getElementById('error-message').replaceChildren();
+
+        const response = await fetch(`/api/dashboard?${params}`, { signal });
+        if (!response.ok) throw new Error('Failed to load dashboard');
+
+        const data = await response.json();
+        await nextFrame();
+        if (signal.aborted) return;
+        pageCursors[1] = data.next_cursor;
+        renderStats(data.stats);
+        renderWorkers(data.workers);
+        renderTasks(data.tasks);
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        document.getElementById('error-message').replaceChildren(message('error', `Error: ${error.message}`));
+        document.getElementById('tasks-container').replaceChildren();
+    }
+}
+
+function renderTasks(tasks) {
+    const container = document.getElementById('tasks-container');
+    const rendered = new Map();
+    if (tasks.length === 0) {
+        taskRows = rendered;
+        container.replaceChildren(message('loading', 'No tasks found'));
+        return;
+    }
+
+    const readwrite = window.dashboardMode === 'readwrite';
+    const table = createTasksTable(readwrite);
+    const rows = document.createDocumentFragment();
+    tasks.forEach(task => rows.appendChild(taskRow(task, readwrite, rendered)));
+    table.querySelector('tbody').appendChild(rows);
+    taskRows = rendered;
+
+    const pagination = createPagination();
+    container.replaceChildren(...(pagination ? [table, pagination] : [table]));
+}
+
+// Rows are cloned from <template>s and filled via textContent: no HTML parsing per row
+function createTasksTable(readwrite) {
+    const table = document.getElementById('tasks-table-template').content.firstElementChild.cloneNode(true);
+    if (!readwrite) table.querySelector('.task-actions').remove();
+    return table;
+}
+
+const TASK_ROW = document.getElementById('task-row-template').content.firstElementChild;
+
+// Task rows currently on screen by task id: {data, node, readwrite}
+let taskRows = new Map();
+
+function sameTask(a, b) {
+    return Object.keys(b).every(key => a[key] === b[key]);
+}
+
+// Reuse the rendered row of an unchanged task instead of building it again; record it in rendered
+function taskRow(task, readwrite, rendered) {
+    const previous = taskRows.get(task.id);
+    const node = previous && previous.readwrite === readwrite && sameTask(previous.data, task)
+        ? previous.node
+        : buildTaskRow(task, readwrite);
+    rendered.set(task.id, { data: task, node, readwrite });
+    return node;
+}
+
+function buildTaskRow(task, readwrite) {
+    const row = TASK_ROW.cloneNode(true);
+    row.dataset.taskId = task.id;
+
+    row.querySelector('.task-name').textContent = task.name;
+    row.querySelector('.task-id').textContent = `${task.id.substring(0, 12)}...`;
+    const badge = row.querySelector('.status-badge');
+    badge.classList.add(`status-${task.state}`);
+    badge.textContent = task.state;
+    row.querySelector('.task-created').textContent = formatDate(task.created_at);
+    row.querySelector('.task-started').textContent = task.started_at ? formatDate(task.started_at) : '–';
+    row.querySelector('.task-completed').textContent = task.completed_at ? formatDate(task.completed_at) : '–';
+    row.querySelector('.task-worker').textContent = task.worker_id ? task.worker_id.substring(0, 8) : '–';
+    row.querySelector('.task-retries').textContent = `${task.retry_count}/${task.max_retries}`;
+    row.querySelector('.task-priority').textContent = task.priority;
+
+    const actions = row.querySelector('.task-actions');
+    if (!readwrite) {
+        actions.remove();
+    } else if (task.state === 'pending') {
+        const cancel = document.createElement('button');
+        cancel.className = 'btn-secondary task-cancel';
+        cancel.style.cssText = 'padding: 4px 8px; font-size: 11px;';
+        cancel.textContent = 'Cancel';
+        actions.appendChild(cancel);
+    } else {
+        actions.textContent = '–';
+    }
+    return row;
+}
+
+function createPagination() {
+    const hasNext = Boolean(pageCursors[currentPage + 1]);
+    if (!hasNext && currentPage === 0) return null;
+
+    const pagination = document.createElement('div');
+    pagination.className = 'pagination';
+    if (currentPage > 0) {
+        pagination.appendChild(pageButton('← Previous', currentPage - 1));
+    }
+    if (hasNext) {
+        pagination.appendChild(pageButton('Next →', currentPage + 1));
+    }
+    return pagination;
+}
+
+function pageButton(label, page) {
+    const button = document.createElement('button');
+    button.className = 'btn-primary';
+    button.textContent = label;
+    button.addEventListener('click', () => loadTasks(page));
+    return button;
+}
+
+// Worker cards currently on screen by worker_id: {data, node}
+let workerCards = new Map();
+const WORKER_CARD = document.getElementById('worker-card-template').content.firstElementChild;
+
+// Patch the existing cards in place: add new workers, drop gone ones, and only touch the
+// text of values that changed
+function renderWorkers(workers) {
+    const section = document.getElementById('workers-section');
+    const container = document.getElementById('workers-container');
+    section.style.display = workers.length === 0 ? 'none' : 'block';
+
+    const cards = new Map();
+    const added = document.createDocumentFragment();
+    workers.forEach(worker => {
+        let card = workerCards.get(worker.worker_id);
+        if (!card) {
+            const node = WORKER_CARD.cloneNode(true);
+            node.querySelector('.worker-id').textContent = worker.worker_id;
+            added.appendChild(node);
+            card = { data: {}, node };
+        }
+        if (card.data.locked_tasks !== worker.locked_tasks) {
+            card.node.querySelector('.worker-locked').textContent = worker.locked_tasks;
+        }
+        if (card.data.earliest_lock_expires !== worker.earliest_lock_expires) {
+            const expires = worker.earliest_lock_expires;
+            card.node.querySelector('.worker-expires-row').style.display = expires ? '' : 'none';
+            card.node.querySelector('.worker-expires').textContent = expires ? formatDate(expires) : '';
+        }
+        card.data = worker;
+        cards.set(worker.worker_id, card);
+    });
+
+    workerCards.forEach((card, workerId) => {
+        if (!cards.has(workerId)) card.node.remove();
+    });
+    container.appendChild(added);
+    workerCards = cards;
+}
+
+// Status line (loading, empty, error) built as a node, so message text is never parsed as HTML
+function message(className, text) {
+    const div = document.createElement('div');
+    div.className = className;
+    div.textContent = text;
+    return div;
+}
+
+// Resolves at the start of the next frame: widgets updated together after awaiting it are
+// laid out once, in that frame, instead of once per write inside the fetch callback
+function nextFrame() {
+    return new Promise(resolve => requestAnimationFrame(resolve));
+}
+
+// Intl.DateTimeFormat.format takes epoch milliseconds, so no Date object is needed per value
+function formatDate(dateString) {
+    return DATE_FORMAT.format(Date.parse(dateString));
+}
+
+function clearTimeFilter() {
+    document.getElementById('filter-relative-time').value = '';
+    document.getElementById('filter-time-from').value = '';
+    document.getElementById('filter-time-to').value = '';
+    applyTimeFilter();
+}
+
+function clearFilters() {
+    for (const [, id] of FILTER_INPUTS) document.getElementById(id).value = '';
+    clearTimeFilter();
+}
+
+async function loadMode() {
+    try {
+        const response = await fetch('/api/mode');
+        const data = await response.json();
+        window.dashboardMode = data.mode;
+
+        const badge = document.getElementById('mode-badge');
+        if (data.mode === 'readwrite') {
+            badge.textContent = '✏️ Read & Write';
+            badge.style.background = 'rgba(59, 130, 246, 0.2)';
+            badge.style.color = 'var(--primary)';
+            document.getElementById('create-task-section').style.display = 'block';
+        } else {
+            badge.textContent = '👁️ Read Only';
+            badge.style.background = 'rgba(107, 114, 128, 0.2)';
+            badge.style.color = 'var(--text-secondary)';
+            document.getElementById('create-task-section').style.display = 'none';
+        }
+    } catch (error) {
+        console.error('Error loading mode:', error);
+    }
+}
+
+async function createTask() {
+    const name = document.getElementById('create-task-name').value.trim();
+    if (!name) {
+        document.getElementById('create-error-message').replaceChildren(message('error', 'Task name is required'));
+        return;
+    }
+
+    const argsText = document.getElementById('create-task-args').value;
+    const kwargsText = document.getElementById('create-task-kwargs').value;
+    const priority = document.getElementById('create-task-priority').value;
+
+    const params = new URLSearchParams({
+        name: name,
+        args: argsText,
+        kwargs: kwargsText,
+        priority: priority
+    });
+
+    try {
+        const response = await fetch(`/api/tasks?${params}`, {
+            method: 'POST'
+        });
+
+        if (!response.ok) {
+            const error = await response.json();
+            throw new Error(error.detail || 'Failed to create task');
+        }
+
+        const task = await response.json();
+        document.getElementById('create-error-message').replaceChildren(message('error success', '✓ Task created successfully'));
+        clearCreateForm();
+        setTimeout(() => {
+            loadDashboard();
+        }, 500);
+    } catch (error) {
+        document.getElementById('create-error-message').replaceChildren(message('error', `Error: ${error.message}`));
+    }
+}
+
+function clearCreateForm() {
+    document.getElementById('create-task-name').value = '';
+    document.getElementById('create-task-priority').value = '0';
+    document.getElementById('create-task-args').value = '{}';
+    document.getElementById('create-task-kwargs').value = '{}';
+    document.getElementById('create-error-message').replaceChildren();
+}
+
+async function openTaskModal(taskId) {
+    try {
+        const response = await fetch(`/api/task/${taskId}`);
+        if (!response.ok) throw new Error('Failed to load task');
+
+        const task = await response.json();
+        displayTaskDetail(task);
+
+        const modal = document.getElementById('task-detail-modal');
+        modal.classList.add('show');
+    } catch (error) {
+        alert(`Error: ${error.message}`);
+    }
+}
+
+function closeTaskModal() {
+    const modal = document.getElementById('task-detail-modal');
+    modal.classList.remove('show');
+}
+
+// Values are written with textContent, so task data never goes through HTML parsing
+function detailSection(label, value, valueClass = 'text', wide = false) {
+    const section = document.createElement('div');
+    section.className = wide ? 'detail-section detail-row' : 'detail-section';
+    const labelNode = document.createElement('div');
+    labelNode.className = 'detail-label';
+    labelNode.textContent = label;
+    const valueNode = document.createElement('div');
+    valueNode.className = `detail-value ${valueClass}`.trim();
+    valueNode.textContent = value;
+    section.append(labelNode, valueNode);
+    return section;
+}
+
+function jsonSection(label, value) {
+    return detailSection(label, JSON.stringify(value, null, 2), 'json', true);
+}
+
+function displayTaskDetail(task) {
+    document.getElementById('modal-task-name').textContent = task.name;
+
+    const sections = [detailSection('Task ID', task.id, '')];
+
+    const state = detailSection('State', '');
+    const badge = document.createElement('span');
+    badge.className = `status-badge status-${task.state}`;
+    badge.textContent = task.state;
+    state.lastChild.appendChild(badge);
+    sections.push(state);
+
+    sections.push(
+        detailSection('Priority', task.priority),
+        detailSection('Worker ID', task.worker_id || '–', ''),
+        detailSection('Retries', `${task.retry_count}/${task.max_retries}`),
+        detailSection('Created At', formatDate(task.created_at)),
+        detailSection('Scheduled At', formatDate(task.scheduled_at)),
+        detailSection('Started At', task.started_at ? formatDate(task.started_at) : '–'),
+        detailSection('Completed At', task.completed_at ? formatDate(task.completed_at) : '–'),
+        jsonSection('Arguments', task.args),
+        jsonSection('Keyword Arguments', task.kwargs),
+        jsonSection('Tags', task.tags),
+    );
+
+    if (task.result) {
+        sections.push(jsonSection('Result', task.result));
+    }
+
+    if (task.error) {
+        const error = detailSection('Error', task.error, 'json', true);
+        error.lastChild.style.color = 'var(--failed)';
+        sections.push(error);
+    }
+
+    // Mock Logs section
+    const logs = detailSection('Logs', [
+        '[2024-10-25 10:23:45] Task started',
+        '[2024-10-25 10:23:46] Processing input data...',
+        '[2024-10-25 10:23:47] Validation passed',
+        '[2024-10-25 10:23:48] Executing main logic...',
+        '[2024-10-25 10:23:49] Writing results to database',
+        '[2024-10-25 10:23:50] Task completed successfully',
+    ].join('\n'), 'json', true);
+    logs.lastChild.style.color = 'var(--text-secondary)';
+    sections.push(logs);
+
+    document.getElementById('modal-task-details').replaceChildren(...sections);
+}
+
+async function cancelTask(taskId) {
+    if (!confirm('Are you sure you want to cancel this task?')) {
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/tasks/${taskId}/cancel`, {
+            method: 'PATCH'
+        });
+
+        if (!response.ok) {
+            const error = await response.json();
+            throw new Error(error.detail || 'Failed to cancel task');
+        }
+
+        loadDashboard();
+    } catch (error) {
+        alert(`Error: ${error.message}`);
+    }
+}
+
+// Close modal when clicking outside
+document.getElementById('task-detail-modal').addEventListener('click', function(event) {
+    if (event.target === this) {
+        closeTaskModal();
+    }
+});
+
+// Initial load
+// One delegated listener serves every task row, however often the table is re-rendered
+document.getElementById('tasks-container').addEventListener('click', event => {
+    const row = event.target.closest('[data-task-id]');
+    if (!row) return;
+    if (event.target.closest('.task-cancel')) {
+        cancelTask(row.dataset.taskId);
+    } else {
+        openTaskModal(row.dataset.taskId);
+    }
+});
+
+loadMode();
+loadDashboard();
+
+// Refresh on task change events pushed by the server instead of polling. Bursts of
+// events are coalesced into one stats/workers refresh per second.
+let refreshTimer = null;
+let refreshController = null;
+let refreshStartedAt = 0;
+let refreshPending = false;
+const REFRESH_TIMEOUT_MS = 15000;
+
+function scheduleRefresh() {
+    if (refreshTimer) return;
+    refreshTimer = setTimeout(() => {
+        refreshTimer = null;
+        refreshDashboard();
+    }, 1000);
+}
+
+// Stats and workers in one request. A refresh requested meanwhile runs once this one
+// resolves; a request stuck for REFRESH_TIMEOUT_MS is aborted and replaced.
+async function refreshDashboard() {
+    if (refreshController) {
+        if (Date.now() - refreshStartedAt < REFRESH_TIMEOUT_MS) {
+            refreshPending = true;
+            return;
+        }
+        refreshController.abort();
+    }
+    const controller = new AbortController();
+    refreshController = controller;
+    refreshStartedAt = Date.now();
+
+    try {
+        const params = new URLSearchParams(getTimeParams());
+        params.append('include_tasks', 'false');
+        const response = await fetch(`/api/dashboard?${params}`, { signal: controller.signal });
+        if (!response.ok) throw new Error('Failed to refresh dashboard');
+
+        const data = await response.json();
+        await nextFrame();
+        if (controller.signal.aborted) return;
+        renderStats(data.stats);
+        renderWorkers(data.workers);
+    } catch (error) {
+        if (error.name !== 'AbortError') console.error('Error refreshing dashboard:', error);
+    } finally {
+        if (refreshController === controller) {
+            refreshController = null;
+            if (refreshPending) {
+                refreshPending = false;
+                refreshDashboard();
+            }
+        }
+    }
+}
+
+// Update the state badge of a task already shown in the table
+function patchTaskState(taskId, state) {
+    const entry = taskRows.get(taskId);
+    if (!entry) return;
+    entry.data = { ...entry.data, state };
+    const row = entry.node;
+    const badge = row.querySelector('.status-badge');
+    badge.className = `status-badge status-${state}`;
+    badge.textContent = state;
+    const actions = row.querySelector('.task-actions');
+    if (actions && state !== 'pending') actions.textContent = '–';
+}
+
+// The event stream is only open while the tab is visible; a hidden dashboard costs the
+// server nothing and is brought up to date with one refresh when shown again.
+let events = null;
+let reconnecting = false;
+
+function startEvents() {
+    if (events) return;
+    events = new EventSource('/api/events');
+    events.addEventListener('task_state_changed', event => {
+        const [taskId, state] = event.data.split(' ');
+        patchTaskState(taskId, state);
+        scheduleRefresh();
+    });
+    events.addEventListener('task_enqueued', scheduleRefresh);
+    // EventSource reconnects by itself; catch up on whatever changed while it was down
+    events.addEventListener('error', () => { reconnecting = true; });
+    events.addEventListener('open', () => {
+        if (reconnecting) loadDashboard();
+        reconnecting = false;
+    });
+}
+
+function stopEvents() {
+    if (!events) return;
+    events.close();
+    events = null;
+    reconnecting = false;
+}
+
+document.addEventListener('visibilitychange', () => {
+    if (document.hidden) {
+        stopEvents();
+    } else {
+        refreshDashboard();
+        startEvents();
+    }
+});
+
+if (!document.hidden) startEvents();
@@ -2,8 +2,10 @@
 
 from .config import Config
 from .core import (
+    count_by_state,
     get_registered_tasks,
     get_task,
+    get_tasks,
     has_error,
     has_result,
     init,
@@ -14,6 +16,7 @@ from .core import (
     is_terminal,
     list_tasks,
     submit_task,
+    submit_tasks,
     task,
 )
 from .exceptions import TaskLibError
@@ -25,7 +28,10 @@ __all__ = [
     "init",
     "task",
     "submit_task",
+    "submit_tasks",
     "get_task",
+    "get_tasks",
+    "count_by_state",
     "list_tasks",
     "get_registered_tasks",
     "is_pending",
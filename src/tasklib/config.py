@@ -28,3 +28,6 @@ class Config:
 
     worker_id: Optional[str] = None
     """Worker ID (auto-generated if not set). Used for locking."""
+
+    prepare_threshold: Optional[int] = 1
+    """Executions before psycopg uses a server-side prepared statement (None disables, e.g. behind PgBouncer)."""
@@ -1,15 +1,19 @@
 """Core tasklib functionality: task decorator and submit_task."""
 
+import functools
 import inspect
-from datetime import datetime, timedelta
+import json
+from datetime import timedelta
 from typing import Any, Callable, Optional
 from uuid import UUID
 
 from pydantic import ValidationError, create_model
+from sqlalchemy import func as sql_func
+from sqlalchemy.engine import Engine, make_url
 from sqlmodel import Session, create_engine, select
 
 from .config import Config
-from .db import Task
+from .db import Task, utcnow
 from .exceptions import TaskAlreadyRegistered, TaskExecutionError, TaskNotFound
 
 _task_registry: dict[str, tuple[Callable, dict]] = {}
@@ -22,10 +26,23 @@ def init(config: Config) -> None:
     global _config, _engine
 
     _config = config
-    _engine = create_engine(config.database_url, echo=False)
+    _engine = create_db_engine(config)
     Task.metadata.create_all(_engine)
 
 
+# JSON columns (args, kwargs, result, tags) are written without the default ", " / ": " padding.
+_dump_json = functools.partial(json.dumps, separators=(",", ":"))
+
+
+def create_db_engine(config: Config) -> Engine:
+    """Create the SQLAlchemy engine, enabling psycopg prepared statements for repeated queries."""
+    connect_args = {}
+    if make_url(config.database_url).get_driver_name() == "psycopg":
+        connect_args["prepare_threshold"] = config.prepare_threshold
+
+    return create_engine(config.database_url, echo=False, connect_args=connect_args, json_serializer=_dump_json)
+
+
 def task(
     func: Optional[Callable] = None,
     *,
@@ -75,6 +92,8 @@ def task(
                 "timeout_seconds": timeout_seconds,
                 "signature": sig,
                 "params_model": params_model,
+                # Bound once here so submissions skip the BaseModel.__init__ wrapper
+                "validate_params": params_model.__pydantic_validator__.validate_python,
             },
         )
 
@@ -114,6 +133,67 @@ async def submit_task(
     Example:
         task_id = await submit_task(send_email, delay_seconds=60, to="user@example.com", subject="Hi")
     """
+    db_task = _build_task(
+        func,
+        delay_seconds=delay_seconds,
+        max_retries=max_retries,
+        timeout_seconds=timeout_seconds,
+        priority=priority,
+        tags=tags,
+        **kwargs,
+    )
+
+    with Session(_engine) as session:  # pyrefly: ignore
+        session.add(db_task)  # pyrefly: ignore
+        session.commit()  # pyrefly: ignore
+        session.refresh(db_task)  # pyrefly: ignore
+        task_id = db_task.id
+
+    return task_id
+
+
+async def submit_tasks(submissions: list[tuple[Callable, dict]]) -> list[UUID]:
+    """
+    Submit several tasks in a single transaction.
+
+    Rows are inserted together, so submitting N tasks costs one round-trip
+    instead of N.
+
+    Args:
+        submissions: (func, kwargs) pairs, where kwargs is what you would pass
+            to submit_task (task arguments plus options like delay_seconds)
+
+    Returns:
+        Task UUIDs, in submission order
+
+    Example:
+        task_ids = await submit_tasks([
+            (send_email, {"to": "a@example.com", "subject": "Hi"}),
+            (send_email, {"to": "b@example.com", "subject": "Hi", "priority": 5}),
+        ])
+    """
+    db_tasks = [_build_task(func, **kwargs) for func, kwargs in submissions]
+    task_ids = [db_task.id for db_task in db_tasks]
+
+    if db_tasks:
+        with Session(_engine) as session:  # pyrefly: ignore
+            session.add_all(db_tasks)  # pyrefly: ignore
+            session.commit()  # pyrefly: ignore
+
+    return task_ids
+
+
+def _build_task(
+    func: Callable,
+    *,
+    delay_seconds: int = 0,
+    max_retries: Optional[int] = None,
+    timeout_seconds: Optional[int] = None,
+    priority: int = 0,
+    tags: Optional[dict] = None,
+    **kwargs,
+) -> Task:
+    """Validate a submission and build its (unsaved) Task row."""
     if _config is None or _engine is None:
         raise RuntimeError("tasklib not initialized. Call tasklib.init(config) first.")
 
@@ -122,25 +202,29 @@ async def submit_task(
         raise TaskNotFound(f"Task '{task_name}' not registered. Use @task decorator.")
 
     registered_func, metadata = _task_registry[task_name]
-    params_model = metadata["params_model"]
-
     try:
-        validated_params = params_model(**kwargs)
-        validated_kwargs = validated_params.model_dump()
+        validated_kwargs = metadata["validate_params"](kwargs).model_dump()
     except ValidationError as e:
         raise TaskExecutionError(f"Invalid arguments for task '{task_name}': {e.json()}")
 
+    # priority is stored as SMALLINT
+    if not -32768 <= priority <= 32767:
+        raise TaskExecutionError(f"Priority {priority} out of range for task '{task_name}' (-32768..32767)")
+
     final_max_retries = max_retries if max_retries is not None else metadata["max_retries"]
     if final_max_retries is None:
         final_max_retries = _config.max_retries
+    # max_retries is stored as SMALLINT too
+    if not -32768 <= final_max_retries <= 32767:
+        raise TaskExecutionError(f"max_retries {final_max_retries} out of range for task '{task_name}' (-32768..32767)")
 
     final_timeout = timeout_seconds if timeout_seconds is not None else metadata["timeout_seconds"]
     if final_timeout is None:
         final_timeout = _config.default_task_timeout_seconds
 
-    scheduled_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
+    scheduled_at = utcnow() + timedelta(seconds=delay_seconds)
 
-    db_task = Task(
+    return Task(
         name=task_name,
         kwargs=validated_kwargs,
         args={},
@@ -152,14 +236,6 @@ async def submit_task(
         tags=tags or {},
     )
 
-    with Session(_engine) as session:  # pyrefly: ignore
-        session.add(db_task)  # pyrefly: ignore
-        session.commit()  # pyrefly: ignore
-        session.refresh(db_task)  # pyrefly: ignore
-        task_id = db_task.id
-
-    return task_id
-
 
 def get_task(task_id: UUID) -> Optional[Task]:
     """Get task by ID."""
@@ -171,6 +247,54 @@ def get_task(task_id: UUID) -> Optional[Task]:
         return session.exec(statement).first()  # pyrefly: ignore
 
 
+def get_tasks(task_ids: list[UUID]) -> list[Task]:
+    """
+    Get several tasks by ID in a single query.
+
+    Args:
+        task_ids: Task UUIDs to fetch
+
+    Returns:
+        Found tasks, in the order of task_ids (missing IDs are skipped)
+    """
+    if _engine is None:
+        raise RuntimeError("tasklib not initialized. Call tasklib.init(config) first.")
+
+    if not task_ids:
+        return []
+
+    with Session(_engine) as session:  # pyrefly: ignore
+        statement = select(Task).where(Task.id.in_(task_ids))  # pyrefly: ignore
+        tasks_by_id = {t.id: t for t in session.exec(statement).all()}  # pyrefly: ignore
+
+    return [tasks_by_id[task_id] for task_id in task_ids if task_id in tasks_by_id]
+
+
+def count_by_state(task_ids: list[UUID]) -> dict[str, int]:
+    """
+    Count tasks per state, aggregated in the database.
+
+    Args:
+        task_ids: Task UUIDs to count
+
+    Returns:
+        Mapping of state to number of tasks (states with no tasks are omitted)
+    """
+    if _engine is None:
+        raise RuntimeError("tasklib not initialized. Call tasklib.init(config) first.")
+
+    if not task_ids:
+        return {}
+
+    with Session(_engine) as session:  # pyrefly: ignore
+        statement = (
+            select(Task.state, sql_func.count())
+            .where(Task.id.in_(task_ids))  # pyrefly: ignore
+            .group_by(Task.state)
+        )
+        return dict(session.exec(statement).all())  # pyrefly: ignore
+
+
 def list_tasks(
     state: Optional[str] = None,
     name: Optional[str] = None,
@@ -1,5 +1,15 @@
 """TaskLib database module."""
 
-from .models import Task
+from .migrations import create_indexes_concurrently, install_notify_triggers
+from .models import Task, utcnow
+from .notify import TASK_ENQUEUED, TASK_STATE_CHANGED, TaskListener
 
-__all__ = ["Task"]
+__all__ = [
+    "Task",
+    "TaskListener",
+    "TASK_ENQUEUED",
+    "TASK_STATE_CHANGED",
+    "create_indexes_concurrently",
+    "install_notify_triggers",
+    "utcnow",
+]
@@ -1 +1,129 @@
-"""Database models for TaskLib."""
+"""Schema maintenance helpers for existing tasks tables."""
+
+import logging
+
+from sqlalchemy import Connection, Index
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex
+
+from .models import Task
+from .notify import _NOTIFY_TRIGGERS
+
+logger = logging.getLogger(__name__)
+
+# Indexes created by earlier versions that ix_tasks_dequeue now covers.
+_OBSOLETE_INDEXES = ["ix_tasks_scheduled_at", "ix_tasks_state", "ix_tasks_priority"]
+
+# GIN jsonb_path_ops index; cannot be built while tags is still the json column of older tables.
+_TAGS_INDEX = "ix_tasks_tags"
+
+_INVALID_INDEXES_SQL = """
+    SELECT c.relname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE i.indrelid = 'tasks'::regclass AND NOT i.indisvalid
+"""
+
+_FULL_INDEXES_SQL = """
+    SELECT c.relname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE i.indrelid = 'tasks'::regclass AND i.indpred IS NULL
+"""
+
+_TRIGGERS_SQL = """
+    SELECT tgname FROM pg_trigger WHERE tgrelid = 'tasks'::regclass AND NOT tgisinternal
+"""
+
+_TAGS_TYPE_SQL = """
+    SELECT format_type(atttypid, atttypmod)
+    FROM pg_attribute
+    WHERE attrelid = 'tasks'::regclass AND attname = 'tags'
+"""
+
+
+def _create_concurrently(conn: Connection, index: Index, name: str) -> None:
+    """Build ``index`` under ``name`` with CREATE INDEX CONCURRENTLY IF NOT EXISTS."""
+    statement = str(CreateIndex(index, if_not_exists=True).compile(dialect=conn.dialect))
+    statement = statement.replace(f"IF NOT EXISTS {index.name} ", f"IF NOT EXISTS {name} ", 1)
+    conn.exec_driver_sql(statement.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1))
+
+
+def create_indexes_concurrently(engine: Engine) -> None:
+    """
+    Bring the indexes of an existing tasks table up to date without blocking writes.
+
+    ``init()`` only creates indexes together with a new table. This builds any missing Task
+    index with ``CREATE INDEX CONCURRENTLY`` and drops obsolete ones with ``DROP INDEX
+    CONCURRENTLY``, each in autocommit mode since neither may run inside a transaction.
+    Indexes left invalid by an interrupted build are dropped and rebuilt. No-op outside
+    PostgreSQL.
+
+    Earlier versions created ``ix_tasks_next_retry_at`` and ``ix_tasks_locked_until`` as
+    full indexes. A Task index that is partial but exists without a WHERE clause is built
+    under a ``_new`` name, then swapped in by dropping the old index and renaming. The
+    rename takes a brief ACCESS EXCLUSIVE lock on the index only.
+
+    ``ix_tasks_tags`` needs ``tags`` to be jsonb and is skipped, with a warning, while it is
+    still json. Converting it (``ALTER TABLE tasks ALTER COLUMN tags TYPE jsonb USING
+    tags::jsonb``) rewrites the table under an ACCESS EXCLUSIVE lock, so it is left to a
+    maintenance window; run this again afterwards to build the index.
+
+    Args:
+        engine: Engine connected to the tasklib database
+
+    Example:
+        engine = create_engine(config.database_url)
+        create_indexes_concurrently(engine)
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        invalid = [row[0] for row in conn.exec_driver_sql(_INVALID_INDEXES_SQL)]
+        for name in invalid + _OBSOLETE_INDEXES:
+            conn.exec_driver_sql(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+
+        full = {row[0] for row in conn.exec_driver_sql(_FULL_INDEXES_SQL)}
+        tags_type = conn.exec_driver_sql(_TAGS_TYPE_SQL).scalar()
+
+        for index in Task.__table__.indexes:  # pyrefly: ignore
+            if index.name == _TAGS_INDEX and tags_type != "jsonb":
+                logger.warning("Skipping %s: tasks.tags is %s, not jsonb", index.name, tags_type)
+                continue
+
+            if index.name in full and index.dialect_options["postgresql"]["where"] is not None:
+                # A leftover invalid _new index was dropped above; a valid one is reused
+                _create_concurrently(conn, index, f"{index.name}_new")
+                conn.exec_driver_sql(f'DROP INDEX CONCURRENTLY "{index.name}"')
+                conn.exec_driver_sql(f'ALTER INDEX "{index.name}_new" RENAME TO "{index.name}"')
+                continue
+
+            _create_concurrently(conn, index, index.name)
+
+
+def install_notify_triggers(engine: Engine) -> None:
+    """
+    Add the NOTIFY triggers (task_state_changed, task_enqueued) to an existing tasks table.
+
+    ``init()`` creates them only together with a new table. Run this once for tables created
+    by earlier versions, as the table owner: CREATE TRIGGER briefly takes a SHARE ROW EXCLUSIVE
+    lock on tasks. Triggers already present (see pg_trigger) are left alone. No-op outside
+    PostgreSQL.
+
+    Args:
+        engine: Engine connected to the tasklib database
+
+    Example:
+        engine = create_engine(config.database_url)
+        install_notify_triggers(engine)
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    with engine.begin() as conn:
+        existing = {row[0] for row in conn.exec_driver_sql(_TRIGGERS_SQL)}
+        for name, statements in _NOTIFY_TRIGGERS.items():
+            if name not in existing:
+                for statement in statements:
+                    conn.exec_driver_sql(statement)
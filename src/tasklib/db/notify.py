@@ -0,0 +1,126 @@
+"""PostgreSQL LISTEN/NOTIFY support for task events."""
+
+from typing import Optional
+
+import psycopg
+from psycopg import sql
+from sqlalchemy import DDL, event
+from sqlalchemy.engine import make_url
+
+from .models import Task
+
+TASK_STATE_CHANGED = "task_state_changed"
+"""Channel notified on every task state transition (payload: '<task_id> <new_state>')."""
+
+TASK_ENQUEUED = "task_enqueued"
+"""Channel notified once per INSERT statement on tasks (empty payload). Used to wake idle workers."""
+
+# Trigger name -> (trigger function, trigger) DDL. Created with a new tasks table; existing
+# tables get them once from install_notify_triggers (tasklib.db.migrations).
+_NOTIFY_TRIGGERS = {
+    "tasks_notify_state_changed": (
+        f"""
+        CREATE OR REPLACE FUNCTION tasklib_notify_state_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{TASK_STATE_CHANGED}', NEW.id::text || ' ' || NEW.state);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER tasks_notify_state_changed
+            AFTER UPDATE OF state ON tasks
+            FOR EACH ROW
+            WHEN (OLD.state IS DISTINCT FROM NEW.state)
+            EXECUTE FUNCTION tasklib_notify_state_changed()
+        """,
+    ),
+    "tasks_notify_task_enqueued": (
+        f"""
+        CREATE OR REPLACE FUNCTION tasklib_notify_task_enqueued() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{TASK_ENQUEUED}', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE TRIGGER tasks_notify_task_enqueued
+            AFTER INSERT ON tasks
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION tasklib_notify_task_enqueued()
+        """,
+    ),
+}
+
+for _statements in _NOTIFY_TRIGGERS.values():
+    for _statement in _statements:
+        event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))  # pyrefly: ignore
+
+
+def _conninfo(database_url: str) -> str:
+    """Convert a SQLAlchemy database URL into a libpq connection string."""
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+
+class TaskListener:
+    """
+    Dedicated connection listening on a task notification channel.
+
+    Example:
+        async with TaskListener(config.database_url, TASK_STATE_CHANGED) as listener:
+            payloads = await listener.wait(timeout=30)
+    """
+
+    def __init__(self, database_url: str, channel: str):
+        """
+        Initialize listener.
+
+        Args:
+            database_url: PostgreSQL connection URL
+            channel: Notification channel to LISTEN on
+        """
+        self.database_url = database_url
+        self.channel = channel
+        self._conn: Optional[psycopg.AsyncConnection] = None
+
+    async def __aenter__(self) -> "TaskListener":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def connect(self) -> None:
+        """Open the connection and LISTEN on the channel. Raises psycopg.Error if the database is unreachable."""
+        conn = await psycopg.AsyncConnection.connect(_conninfo(self.database_url), autocommit=True)
+        try:
+            await conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+        except BaseException:
+            await conn.close()
+            raise
+        self._conn = conn
+
+    async def close(self) -> None:
+        """Close the connection (also safe after it was lost)."""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    async def wait(self, timeout: float) -> list[str]:
+        """
+        Wait for notifications on the channel.
+
+        Blocks until at least one notification arrives or the timeout expires,
+        then drains anything else already queued.
+
+        Returns:
+            Notification payloads (empty if the timeout expired)
+        """
+        if self._conn is None:
+            raise RuntimeError("TaskListener not connected. Use 'async with TaskListener(...)'.")
+
+        payloads = [n.payload async for n in self._conn.notifies(timeout=timeout, stop_after=1)]
+        if payloads:
+            payloads.extend([n.payload async for n in self._conn.notifies(timeout=0)])
+        return payloads
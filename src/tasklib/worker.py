@@ -4,18 +4,23 @@ import asyncio
 import logging
 import traceback
 import uuid
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any, Callable, Optional
 
-from sqlmodel import Session, create_engine, select
+import psycopg
+from sqlalchemy import update
+from sqlmodel import Session, select
 
 from .config import Config
-from .core import _task_registry
-from .db import Task
+from .core import _task_registry, create_db_engine
+from .db import TASK_ENQUEUED, Task, TaskListener, utcnow
 from .exceptions import TaskExecutionError, TaskTimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound of the delay between attempts to reopen a lost LISTEN connection (seconds)
+LISTENER_MAX_BACKOFF_SECONDS = 30.0
+
 
 class TaskWorker:
     """
@@ -32,6 +37,7 @@ class TaskWorker:
         config: Config,
         concurrency: int = 1,
         poll_interval_seconds: float = 1.0,
+        task_names: Optional[list[str]] = None,
     ):
         """
         Initialize worker.
@@ -39,28 +45,39 @@ class TaskWorker:
         Args:
             config: TaskLib configuration
             concurrency: Number of concurrent tasks to execute
-            poll_interval_seconds: How often to poll for new tasks (seconds)
+            poll_interval_seconds: How often to poll for new tasks (seconds). On PostgreSQL the
+                worker also wakes immediately when a task is enqueued, so this is only the fallback
+                for delayed tasks and retries.
+            task_names: Only pick up tasks with these names (default: any task)
         """
         self.config = config
         self.concurrency = concurrency
         self.poll_interval_seconds = poll_interval_seconds
+        self.task_names = task_names
         self.worker_id = config.worker_id or str(uuid.uuid4())
-        self.engine = create_engine(config.database_url, echo=False)
+        self.engine = create_db_engine(config)
 
         Task.metadata.create_all(self.engine)
 
         self._running_tasks: set[asyncio.Task] = set()
         self._shutdown: bool = False
 
+        # LISTEN connection; while it is down the worker falls back to polling and retries with backoff
+        self._listener: Optional[TaskListener] = None
+        self._listener_backoff: float = poll_interval_seconds
+        self._listener_retry_at: float = 0.0
+
     async def run(self) -> None:
         """Run the worker (blocks until shutdown)."""
         logger.info(f"Starting TaskWorker {self.worker_id} with concurrency={self.concurrency}")
 
         try:
             while not self._shutdown:
+                queue_empty = False
                 for _ in range(self.concurrency - len(self._running_tasks)):
                     task = self._try_acquire_task()
                     if task is None:
+                        queue_empty = True
                         break
 
                     coro = self._execute_task(task)
@@ -68,41 +85,114 @@ class TaskWorker:
                     self._running_tasks.add(async_task)
                     async_task.add_done_callback(lambda t: self._running_tasks.discard(t))
 
-                await asyncio.sleep(self.poll_interval_seconds)
+                await self._wait_for_work(queue_empty)
 
         except KeyboardInterrupt:
             logger.info("Received interrupt, shutting down...")
         finally:
+            await self._close_listener()
             await self.shutdown()
 
+    async def _wait_for_work(self, queue_empty: bool) -> None:
+        """
+        Sleep until there may be work to pick up, or at most poll_interval_seconds.
+
+        If all slots are busy and the queue may still hold tasks, wake as soon as a
+        running task finishes. Otherwise wait for a new task to be enqueued, or just
+        sleep while the LISTEN connection is unavailable.
+        """
+        if not queue_empty and self._running_tasks:
+            await asyncio.wait(
+                set(self._running_tasks),
+                timeout=self.poll_interval_seconds,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            return
+
+        listener = await self._ensure_listener()
+        if listener is None:
+            await asyncio.sleep(self.poll_interval_seconds)
+            return
+
+        try:
+            await listener.wait(timeout=self.poll_interval_seconds)
+        except psycopg.Error as e:
+            logger.warning(f"Task listener disconnected, falling back to polling: {e}")
+            await self._close_listener()
+            self._schedule_listener_retry()
+            await asyncio.sleep(self.poll_interval_seconds)
+
+    async def _ensure_listener(self) -> Optional[TaskListener]:
+        """
+        Return the LISTEN connection, (re)opening it once the backoff delay has passed.
+
+        Returns None outside PostgreSQL and while the database cannot be reached.
+        """
+        if self._listener is not None or self.engine.dialect.name != "postgresql":
+            return self._listener
+        if asyncio.get_running_loop().time() < self._listener_retry_at:
+            return None
+
+        listener = TaskListener(self.config.database_url, TASK_ENQUEUED)
+        try:
+            await listener.connect()
+        except psycopg.Error as e:
+            logger.warning(f"Could not open task listener, retrying in {self._listener_backoff:.0f}s: {e}")
+            self._schedule_listener_retry()
+            return None
+
+        self._listener = listener
+        self._listener_backoff = self.poll_interval_seconds
+        return listener
+
+    def _schedule_listener_retry(self) -> None:
+        """Delay the next listener connection attempt, doubling the delay up to LISTENER_MAX_BACKOFF_SECONDS."""
+        self._listener_retry_at = asyncio.get_running_loop().time() + self._listener_backoff
+        self._listener_backoff = min(self._listener_backoff * 2, LISTENER_MAX_BACKOFF_SECONDS)
+
+    async def _close_listener(self) -> None:
+        """Close the LISTEN connection, if open."""
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            await listener.close()
+
     def _try_acquire_task(self) -> Optional[Task]:
-        """Try to acquire and lock a task for execution using PostgreSQL SELECT FOR UPDATE."""
+        """
+        Try to acquire and lock a task for execution.
+
+        The candidate is picked with a narrow ``SELECT id ... FOR UPDATE SKIP LOCKED`` subquery
+        (served by ix_tasks_dequeue, or ix_tasks_name_dequeue when task_names is set) and claimed
+        in the same ``UPDATE ... RETURNING`` statement, so concurrent workers skip each other's
+        rows and acquiring costs one round trip.
+        """
         try:
-            with Session(self.engine) as session:  # pyrefly: ignore
-                now = datetime.utcnow()
-                statement = (
-                    select(Task)
+            with Session(self.engine, expire_on_commit=False) as session:  # pyrefly: ignore
+                now = utcnow()
+                candidate = (
+                    select(Task.id)
                     .where(Task.state.in_(["pending", "failed"]))  # pyrefly: ignore
                     .where(Task.scheduled_at <= now)
                     .where((Task.locked_until.is_(None)) | (Task.locked_until < now))  # pyrefly: ignore
                     .order_by(Task.priority.desc(), Task.created_at.asc())  # pyrefly: ignore
                     .limit(1)
-                    .with_for_update()
+                    .with_for_update(skip_locked=True)
+                )
+                if self.task_names is not None:
+                    candidate = candidate.where(Task.name.in_(self.task_names))  # pyrefly: ignore
+                statement = (
+                    update(Task)
+                    .where(Task.id == candidate.scalar_subquery())  # pyrefly: ignore
+                    .values(
+                        state="running",
+                        worker_id=self.worker_id,
+                        locked_until=now + timedelta(seconds=self.config.lock_timeout_seconds),
+                        started_at=now,
+                    )
+                    .returning(Task)
                 )
 
-                task = session.exec(statement).first()  # pyrefly: ignore
-                if task is None:
-                    return None
-
-                lock_until = now + timedelta(seconds=self.config.lock_timeout_seconds)
-                task.state = "running"
-                task.worker_id = self.worker_id
-                task.locked_until = lock_until
-                task.started_at = now
-                session.add(task)  # pyrefly: ignore
+                task = session.execute(statement).scalars().first()  # pyrefly: ignore
                 session.commit()  # pyrefly: ignore
-                session.refresh(task)  # pyrefly: ignore
-
                 return task
 
         except Exception as e:
@@ -150,7 +240,7 @@ class TaskWorker:
             if db_task:
                 db_task.state = "completed"
                 db_task.result = {"value": result} if result is not None else None
-                db_task.completed_at = datetime.utcnow()
+                db_task.completed_at = utcnow()
                 db_task.locked_until = None
                 db_task.worker_id = None
                 session.add(db_task)  # pyrefly: ignore
@@ -170,7 +260,7 @@ class TaskWorker:
                 delay = self.config.base_retry_delay_seconds * (
                     self.config.retry_backoff_multiplier ** (retry_count - 1)
                 )
-                next_retry = datetime.utcnow() + timedelta(seconds=delay)
+                next_retry = utcnow() + timedelta(seconds=delay)
 
                 db_task.state = "failed"
                 db_task.retry_count = retry_count
@@ -186,7 +276,7 @@ class TaskWorker:
             else:
                 db_task.state = "failed"
                 db_task.error = error_msg
-                db_task.completed_at = datetime.utcnow()
+                db_task.completed_at = utcnow()
                 db_task.locked_until = None
                 db_task.worker_id = None
 
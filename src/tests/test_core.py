@@ -114,9 +114,9 @@ class TestSubmitTask:
         assert t is not None
 
         # Verify scheduled_at is in the future
-        from datetime import datetime
+        from datetime import datetime, timezone
 
-        assert t.scheduled_at > datetime.utcnow()
+        assert t.scheduled_at > datetime.now(timezone.utc)
 
     @pytest.mark.unit
     @pytest.mark.asyncio
@@ -142,6 +142,172 @@ class TestSubmitTask:
         with pytest.raises(tasklib.TaskLibError):
             await tasklib.submit_task(typed_task, x=5)
 
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_submit_tasks(self, init_tasklib):
+        """Test submitting several tasks in one batch."""
+
+        @task
+        def batched(x: int) -> int:
+            return x
+
+        task_ids = await tasklib.submit_tasks(
+            [
+                (batched, {"x": 1}),
+                (batched, {"x": 2, "priority": 5}),
+            ]
+        )
+
+        assert len(task_ids) == 2
+        first, second = tasklib.get_tasks(task_ids)
+        assert first.kwargs == {"x": 1}
+        assert second.kwargs == {"x": 2}
+        assert second.priority == 5
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_submit_tasks_validates_all(self, init_tasklib):
+        """Test that one invalid submission rejects the whole batch."""
+
+        @task
+        def batched(x: int) -> int:
+            return x
+
+        with pytest.raises(tasklib.TaskLibError):
+            await tasklib.submit_tasks([(batched, {"x": 1}), (batched, {})])
+
+        assert tasklib.list_tasks(name="batched") == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_submit_priority_out_of_range(self, init_tasklib):
+        """Test that priorities outside the SMALLINT range are rejected."""
+
+        @task
+        def prioritized() -> None:
+            pass
+
+        with pytest.raises(tasklib.TaskLibError):
+            await tasklib.submit_task(prioritized, priority=40000)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_submit_max_retries_out_of_range(self, init_tasklib):
+        """Test that max_retries outside the SMALLINT range is rejected."""
+
+        @task
+        def retried() -> None:
+            pass
+
+        with pytest.raises(tasklib.TaskLibError):
+            await tasklib.submit_task(retried, max_retries=40000)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_kwargs_stored_compact(self, init_tasklib):
+        """Test that JSON payloads are stored without separator padding."""
+        from sqlalchemy import text
+
+        from tasklib.core import _engine
+
+        @task
+        def compact(a: int, b: str) -> None:
+            pass
+
+        task_id = await tasklib.submit_task(compact, a=1, b="x")
+
+        with _engine.connect() as conn:
+            raw = conn.execute(text("SELECT kwargs FROM tasks WHERE id = :id"), {"id": task_id.hex}).scalar()
+        assert raw == '{"a":1,"b":"x"}'
+
+
+class TestTaskIds:
+    """Test task ID generation."""
+
+    @pytest.mark.unit
+    def test_uuid7_is_time_ordered(self):
+        """Test that task IDs are version 7 UUIDs that sort by creation time."""
+        import time
+
+        from tasklib.db.models import uuid7
+
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first.version == 7
+        assert first < second
+        assert first.hex[:12] != second.hex[:12]
+
+
+class TestSchema:
+    """Test schema constraints."""
+
+    @pytest.mark.unit
+    def test_invalid_state_rejected(self, init_tasklib):
+        """Test that the database rejects unknown task states."""
+        from sqlalchemy.exc import IntegrityError
+        from sqlmodel import Session
+
+        from tasklib.core import _engine
+        from tasklib.db import Task
+
+        with Session(_engine) as session:
+            session.add(Task(name="bogus", state="bogus"))
+            with pytest.raises(IntegrityError):
+                session.commit()
+
+
+class TestGetTasks:
+    """Test batched task lookup."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_tasks(self, init_tasklib):
+        """Test fetching several tasks in one call."""
+
+        @task
+        def batch_task(x: int) -> int:
+            return x
+
+        first = await tasklib.submit_task(batch_task, x=1)
+        second = await tasklib.submit_task(batch_task, x=2)
+
+        tasks = tasklib.get_tasks([second, first])
+        assert [t.id for t in tasks] == [second, first]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_get_tasks_skips_missing(self, init_tasklib):
+        """Test that unknown IDs are skipped."""
+        from uuid import uuid4
+
+        @task
+        def batch_task() -> None:
+            pass
+
+        task_id = await tasklib.submit_task(batch_task)
+
+        tasks = tasklib.get_tasks([uuid4(), task_id])
+        assert [t.id for t in tasks] == [task_id]
+        assert tasklib.get_tasks([]) == []
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_count_by_state(self, init_tasklib):
+        """Test counting tasks per state."""
+        from uuid import uuid4
+
+        @task
+        def count_task() -> None:
+            pass
+
+        task_ids = [await tasklib.submit_task(count_task) for _ in range(3)]
+
+        assert tasklib.count_by_state(task_ids + [uuid4()]) == {"pending": 3}
+        assert tasklib.count_by_state(task_ids[:1]) == {"pending": 1}
+        assert tasklib.count_by_state([]) == {}
+
 
 class TestTaskListing:
     """Test task listing and filtering."""
@@ -196,6 +362,38 @@ class TestTaskListing:
         assert all(t.name == "my_named_task" for t in tasks)
 
 
+class TestWorkerListener:
+    """Test the worker's LISTEN connection fallback."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_lost_listener_falls_back_to_polling(self, config):
+        """Test that a dropped LISTEN connection is closed and retried later instead of stopping the worker."""
+        import psycopg
+
+        from tasklib.worker import TaskWorker
+
+        class BrokenListener:
+            closed = False
+
+            async def wait(self, timeout: float) -> list[str]:
+                raise psycopg.OperationalError("server closed the connection unexpectedly")
+
+            async def close(self) -> None:
+                self.closed = True
+
+        worker = TaskWorker(config, poll_interval_seconds=0.01)
+        listener = BrokenListener()
+        worker._listener = listener  # type: ignore[assignment]
+
+        await worker._wait_for_work(queue_empty=True)
+
+        assert listener.closed
+        assert worker._listener is None
+        assert worker._listener_retry_at > 0
+        assert worker._listener_backoff == 0.02
+
+
 class TestConfiguration:
     """Test configuration."""
 
@@ -221,3 +419,4 @@ class TestConfiguration:
         assert config.base_retry_delay_seconds == 5.0
         assert config.retry_backoff_multiplier == 2.0
         assert config.lock_timeout_seconds == 600
+        assert config.prepare_threshold == 1
@@ -0,0 +1,178 @@
+"""Tests for the dashboard's request and pagination helpers (src/dashboard/app.py)."""
+
+import asyncio
+import importlib
+import sys
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+DASHBOARD_DIR = str(Path(__file__).parent.parent / "dashboard")
+
+PageRow = namedtuple("PageRow", ["id", "created_at"])
+
+
+@pytest.fixture(scope="module")
+def dashboard():
+    """Import the dashboard app module; nothing connects to a database until a query runs."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("orjson")
+    sys.path.insert(0, DASHBOARD_DIR)
+    try:
+        yield importlib.import_module("app")
+    finally:
+        sys.path.remove(DASHBOARD_DIR)
+        sys.modules.pop("app", None)
+        sys.modules.pop("models", None)
+
+
+def make_request(**headers: str):
+    """Starlette request carrying only the given headers."""
+    from starlette.requests import Request
+
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+class TestAcceptsGzip:
+    """Test Accept-Encoding parsing."""
+
+    @pytest.mark.unit
+    def test_gzip_listed(self, dashboard):
+        """Test that an explicit gzip entry is accepted, with or without a q-value."""
+        assert dashboard.accepts_gzip(make_request(accept_encoding="br, gzip"))
+        assert dashboard.accepts_gzip(make_request(accept_encoding="gzip;q=0.5"))
+
+    @pytest.mark.unit
+    def test_q_zero_refuses(self, dashboard):
+        """Test that q=0 refuses gzip, also when * would allow it."""
+        assert not dashboard.accepts_gzip(make_request(accept_encoding="gzip;q=0"))
+        assert not dashboard.accepts_gzip(make_request(accept_encoding="*, gzip;q=0"))
+
+    @pytest.mark.unit
+    def test_wildcard(self, dashboard):
+        """Test that * covers gzip unless it is refused itself."""
+        assert dashboard.accepts_gzip(make_request(accept_encoding="*"))
+        assert not dashboard.accepts_gzip(make_request(accept_encoding="*;q=0"))
+
+    @pytest.mark.unit
+    def test_missing_or_invalid(self, dashboard):
+        """Test that no header, another coding or a malformed q-value means no gzip."""
+        assert not dashboard.accepts_gzip(make_request())
+        assert not dashboard.accepts_gzip(make_request(accept_encoding="br"))
+        assert not dashboard.accepts_gzip(make_request(accept_encoding="gzip;q=abc"))
+
+
+class TestEtagMatches:
+    """Test If-None-Match comparison."""
+
+    @pytest.mark.unit
+    def test_weak_comparison(self, dashboard):
+        """Test that W/ prefixes on either side are ignored."""
+        assert dashboard.etag_matches(make_request(if_none_match='W/"abc"'), 'W/"abc"')
+        assert dashboard.etag_matches(make_request(if_none_match='"abc"'), 'W/"abc"')
+        assert dashboard.etag_matches(make_request(if_none_match='W/"abc"'), '"abc"')
+
+    @pytest.mark.unit
+    def test_comma_list(self, dashboard):
+        """Test that any tag of a comma-separated list matches."""
+        assert dashboard.etag_matches(make_request(if_none_match='"old", W/"abc" , "other"'), 'W/"abc"')
+        assert not dashboard.etag_matches(make_request(if_none_match='"old", "other"'), 'W/"abc"')
+
+    @pytest.mark.unit
+    def test_star_and_missing(self, dashboard):
+        """Test that * matches any tag and a missing header matches none."""
+        assert dashboard.etag_matches(make_request(if_none_match="*"), 'W/"abc"')
+        assert not dashboard.etag_matches(make_request(), 'W/"abc"')
+
+
+class TestSplitPage:
+    """Test limit + 1 pagination."""
+
+    @staticmethod
+    def rows(count: int) -> list:
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        return [PageRow(UUID(int=i), start.replace(minute=i)) for i in range(count)]
+
+    @pytest.mark.unit
+    def test_exact_limit_has_no_cursor(self, dashboard):
+        """Test that a full last page does not hand out a cursor to an empty page."""
+        rows = self.rows(3)
+        page, cursor = dashboard.split_page(rows, 3)
+        assert page == rows
+        assert cursor is None
+
+    @pytest.mark.unit
+    def test_extra_row_gives_cursor(self, dashboard):
+        """Test that the limit + 1st row is dropped and the cursor points at the last row shown."""
+        rows = self.rows(4)
+        page, cursor = dashboard.split_page(rows, 3)
+        assert page == rows[:3]
+        assert cursor == {"created_at": rows[2].created_at.isoformat(), "id": str(rows[2].id)}
+
+
+class TestParseTimestamp:
+    """Test ISO 8601 query parameter parsing."""
+
+    @pytest.mark.unit
+    def test_trailing_z(self, dashboard):
+        """Test that a trailing Z is read as UTC."""
+        assert dashboard.parse_timestamp("2025-01-01T12:00:00Z") == datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+
+    @pytest.mark.unit
+    def test_offset(self, dashboard):
+        """Test that an explicit offset is kept."""
+        assert dashboard.parse_timestamp("2025-01-01T12:00:00+02:00").utcoffset().total_seconds() == 7200
+
+    @pytest.mark.unit
+    def test_invalid(self, dashboard):
+        """Test that an unparseable value is a 400, not a 500."""
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc_info:
+            dashboard.parse_timestamp("yesterday")
+        assert exc_info.value.status_code == 400
+
+
+class TestCached:
+    """Test the TTL cache of polled endpoints."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_ttl(self, dashboard, monkeypatch):
+        """Test that a value is reused within the TTL and loaded again once it expires."""
+        monkeypatch.setattr(dashboard, "CACHE_TTL_SECONDS", 0.05)
+        monkeypatch.setattr(dashboard, "_cache", {})
+        monkeypatch.setattr(dashboard, "_cache_locks", {})
+        loads = []
+
+        async def load() -> int:
+            loads.append(None)
+            return len(loads)
+
+        assert await dashboard.cached(("key",), load) == 1
+        assert await dashboard.cached(("key",), load) == 1
+        assert await dashboard.cached(("other",), load) == 2
+
+        await asyncio.sleep(0.1)
+        assert await dashboard.cached(("key",), load) == 3
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self, dashboard, monkeypatch):
+        """Test that concurrent misses on one key share a single load."""
+        monkeypatch.setattr(dashboard, "_cache", {})
+        monkeypatch.setattr(dashboard, "_cache_locks", {})
+        loads = []
+
+        async def load() -> str:
+            loads.append(None)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(dashboard.cached(("key",), load) for _ in range(5)))
+        assert results == ["value"] * 5
+        assert len(loads) == 1
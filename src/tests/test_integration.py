@@ -1,7 +1,10 @@
 """Integration tests for tasklib with real PostgreSQL."""
 
 import asyncio
+import importlib
+import sys
 import time
+from pathlib import Path
 from uuid import UUID
 
 import pytest
@@ -110,9 +113,9 @@ class TestTaskSubmissionAndExecution:
         assert tasklib.is_pending(task)
 
         # scheduled_at should be in the future
-        from datetime import datetime
+        from datetime import datetime, timezone
 
-        assert task.scheduled_at > datetime.utcnow()
+        assert task.scheduled_at > datetime.now(timezone.utc)
 
     @pytest.mark.asyncio
     async def test_task_with_custom_config(self, init_db, config):
@@ -149,6 +152,53 @@ class TestTaskSubmissionAndExecution:
         low_idx = task_ids.index(low_priority)
         assert high_idx < low_idx
 
+    @pytest.mark.asyncio
+    async def test_worker_task_names_filter(self, init_db, config):
+        """Test that a worker restricted to task names leaves other tasks pending."""
+
+        @tasklib.task
+        def wanted_task() -> str:
+            return "wanted"
+
+        @tasklib.task
+        def other_task() -> str:
+            return "other"
+
+        wanted_id = await tasklib.submit_task(wanted_task)
+        other_id = await tasklib.submit_task(other_task, priority=10)
+
+        worker = tasklib.TaskWorker(config, concurrency=1, poll_interval_seconds=0.1, task_names=["wanted_task"])
+        try:
+            await asyncio.wait_for(worker.run(), timeout=1.0)
+        except asyncio.TimeoutError:
+            pass
+
+        assert tasklib.is_completed(tasklib.get_task(wanted_id))
+        assert tasklib.is_pending(tasklib.get_task(other_id))
+
+    @pytest.mark.asyncio
+    async def test_worker_wakes_on_enqueue(self, init_db, config):
+        """Test that an idle worker picks up a new task without waiting for the next poll."""
+
+        @tasklib.task
+        def wake_task() -> str:
+            return "ok"
+
+        worker = tasklib.TaskWorker(config, concurrency=1, poll_interval_seconds=30)
+        worker_run = asyncio.create_task(worker.run())
+
+        # Let the worker find an empty queue and start waiting
+        await asyncio.sleep(0.5)
+        task_id = await tasklib.submit_task(wake_task)
+        await asyncio.sleep(1.0)
+
+        worker_run.cancel()
+        await asyncio.gather(worker_run, return_exceptions=True)
+
+        task = tasklib.get_task(task_id)
+        assert task is not None
+        assert tasklib.is_completed(task)
+
 
 class TestTaskFailureAndRetry:
     """Test failure handling and retries."""
@@ -432,6 +482,116 @@ class TestTaskMonitoring:
         assert tasklib.has_result(task)
         assert not tasklib.has_error(task)
 
+    @pytest.mark.asyncio
+    async def test_state_change_notification(self, init_db, config):
+        """Test that state transitions are pushed via NOTIFY."""
+        from tasklib.db import TASK_STATE_CHANGED, TaskListener
+
+        @tasklib.task
+        def notified_task() -> str:
+            return "ok"
+
+        task_id = await tasklib.submit_task(notified_task)
+
+        async with TaskListener(config.database_url, TASK_STATE_CHANGED) as listener:
+            worker = tasklib.TaskWorker(config, concurrency=1, poll_interval_seconds=0.1)
+
+            try:
+                await asyncio.wait_for(worker.run(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+
+            payloads = await listener.wait(timeout=1.0)
+
+        assert f"{task_id} running" in payloads
+        assert f"{task_id} completed" in payloads
+
+
+class TestSchema:
+    """Test schema maintenance helpers."""
+
+    def test_create_indexes_concurrently(self, init_db, database_url):
+        """Test that missing indexes are built and obsolete ones dropped."""
+        from sqlalchemy import create_engine, text
+
+        from tasklib.db import create_indexes_concurrently
+
+        engine = create_engine(database_url)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_tasks_dequeue"))
+            conn.execute(text("CREATE INDEX ix_tasks_state ON tasks (state)"))
+
+        create_indexes_concurrently(engine)
+
+        with engine.connect() as conn:
+            indexes = set(conn.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'tasks'")).scalars())
+        assert "ix_tasks_dequeue" in indexes
+        assert "ix_tasks_state" not in indexes
+
+    def test_install_notify_triggers(self, init_db, database_url):
+        """Test that missing NOTIFY triggers are added once and existing ones are left alone."""
+        from sqlalchemy import create_engine, text
+
+        from tasklib.db import install_notify_triggers
+
+        engine = create_engine(database_url)
+        with engine.begin() as conn:
+            conn.execute(text("DROP TRIGGER tasks_notify_task_enqueued ON tasks"))
+
+        install_notify_triggers(engine)
+        install_notify_triggers(engine)
+
+        with engine.connect() as conn:
+            triggers = set(
+                conn.execute(
+                    text("SELECT tgname FROM pg_trigger WHERE tgrelid = 'tasks'::regclass AND NOT tgisinternal")
+                ).scalars()
+            )
+        assert triggers == {"tasks_notify_state_changed", "tasks_notify_task_enqueued"}
+
+    def test_create_indexes_concurrently_on_baseline_table(self, init_db, database_url):
+        """Test the helper on a table shaped like the one earlier versions created."""
+        from sqlalchemy import create_engine, text
+
+        from tasklib.db import create_indexes_concurrently
+
+        engine = create_engine(database_url)
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE tasks"))
+            conn.execute(
+                text(
+                    """
+                    CREATE TABLE tasks (
+                        id UUID PRIMARY KEY, name VARCHAR NOT NULL, args JSON, kwargs JSON,
+                        state VARCHAR NOT NULL, result JSON, error VARCHAR,
+                        retry_count INTEGER NOT NULL, max_retries INTEGER NOT NULL, next_retry_at TIMESTAMP,
+                        scheduled_at TIMESTAMP NOT NULL, started_at TIMESTAMP, completed_at TIMESTAMP,
+                        created_at TIMESTAMP NOT NULL, worker_id VARCHAR, locked_until TIMESTAMP,
+                        timeout_seconds INTEGER, priority INTEGER NOT NULL, tags JSON
+                    )
+                    """
+                )
+            )
+            for column in ["name", "state", "next_retry_at", "scheduled_at", "locked_until", "priority"]:
+                conn.execute(text(f"CREATE INDEX ix_tasks_{column} ON tasks ({column})"))
+
+        try:
+            create_indexes_concurrently(engine)
+
+            with engine.connect() as conn:
+                rows = conn.execute(text("SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'tasks'"))
+                indexes = {name: definition for name, definition in rows}
+            assert "ix_tasks_dequeue" in indexes
+            assert "WHERE" in indexes["ix_tasks_next_retry_at"]
+            assert "WHERE" in indexes["ix_tasks_locked_until"]
+            assert "ix_tasks_tags" not in indexes
+            assert not any(name.endswith("_new") for name in indexes)
+        finally:
+            # Let init() recreate the current schema for the following tests
+            with engine.begin() as conn:
+                conn.execute(text("DROP TABLE tasks"))
+            tasklib.init(init_db)
+
 
 class TestRegistration:
     """Test task registration."""
@@ -457,3 +617,60 @@ class TestRegistration:
             @tasklib.task
             def duplicate() -> str:
                 return "second"
+
+
+@pytest.fixture
+def dashboard(init_db, database_url, monkeypatch):
+    """Import the dashboard app (src/dashboard) against the tasklib-created test database."""
+    pytest.importorskip("fastapi")
+    pytest.importorskip("orjson")
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    monkeypatch.setenv("DASHBOARD_MODE", "readwrite")
+    monkeypatch.syspath_prepend(str(Path(__file__).parent.parent / "dashboard"))
+    app = importlib.import_module("app")
+    yield app
+    sys.modules.pop("app", None)
+    sys.modules.pop("models", None)
+
+
+class TestDashboardQueries:
+    """Test the dashboard's queries against the schema tasklib.init() creates."""
+
+    @pytest.mark.asyncio
+    async def test_queries_on_tasklib_schema(self, dashboard):
+        """Test that state filters and writes work with tasklib's task_state enum column."""
+        import orjson
+        from fastapi import HTTPException
+        from sqlalchemy import text
+
+        try:
+            created = orjson.loads((await dashboard.create_task(name="dash", args=None, kwargs=None, priority=0)).body)
+            running = orjson.loads((await dashboard.create_task(name="dash", args=None, kwargs=None, priority=0)).body)
+            assert created["state"] == "pending"
+            assert UUID(created["id"]).version == 7
+
+            async with dashboard.get_db() as db:
+                await db.execute(
+                    text("UPDATE tasks SET state = 'running', worker_id = 'w1', locked_until = now() WHERE id = :id"),
+                    {"id": running["id"]},
+                )
+                await db.commit()
+
+            async with dashboard.get_db() as db:
+                stmt = dashboard.task_list_statement(frozenset({"state"}))
+                rows = (await db.execute(stmt, {"state": "pending", "limit": 10})).all()
+                assert [str(row.id) for row in rows] == [created["id"]]
+
+                stats = await dashboard.read_stats(db, None, None)
+                assert (stats["total"], stats["pending"], stats["running"]) == (2, 1, 1)
+
+                workers = (await db.execute(dashboard.WORKERS_QUERY)).all()
+                assert [(w.worker_id, w.locked_tasks) for w in workers] == [("w1", 1)]
+
+            cancelled = orjson.loads((await dashboard.cancel_task(UUID(created["id"]))).body)
+            assert cancelled["state"] == "cancelled"
+            with pytest.raises(HTTPException) as excinfo:
+                await dashboard.cancel_task(UUID(created["id"]))
+            assert excinfo.value.status_code == 400
+        finally:
+            await dashboard.engine.dispose()